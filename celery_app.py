@@ -62,12 +62,12 @@ def narrate_task(
     max_chars: int = 500,
 ):
     """
-    Run long-form narrate: split text, TTS each chunk, concatenate, write WAV to NARRATE_RESULT_PATH/job_id.wav.
+    Run long-form narrate: split text, TTS each chunk, append each to the WAV at NARRATE_RESULT_PATH/job_id.wav.
     voice_id can be a preset name or a cloned voice_id. Returns {"job_type": "narrate"} on success.
     """
     from config import NARRATE_RESULT_PATH
     from text_utils import MAX_CHUNKS, MAX_TOTAL_CHARS, split_for_tts
-    from tts_service import _is_preset_voice, generate as tts_generate
+    from tts_service import _is_preset_voice, generate_many
     from voice_store import load_embedding_path
 
     if not voice_id:
@@ -92,26 +92,31 @@ def narrate_task(
         if not chunks:
             return {"job_type": "narrate", "status": "failed", "error": "No chunks produced"}
 
-        import numpy as np
         import soundfile as sf
 
-        audio_list = []
-        sr_out = None
-        for chunk in chunks:
-            audio, sr = tts_generate(
-                chunk,
+        # Append each chunk to the WAV as it is generated; no list of chunks or concatenated copy is held
+        out = None
+        try:
+            # Chunk N+1 is synthesized while chunk N is written (torch releases the GIL during inference);
+            # the shared model still runs one synthesis at a time unless TTS_INPROCESS_CONCURRENCY says otherwise
+            for audio, sr in generate_many(
+                chunks,
                 language_tag=language_tag,
                 speaker_emb_path=speaker_emb_path,
                 temperature=0.65,
                 top_p=0.80,
                 repetition_penalty=1.15,
-            )
-            if sr_out is None:
-                sr_out = sr
-            audio_list.append(audio)
-
-        concatenated = np.concatenate(audio_list)
-        sf.write(out_path, concatenated, sr_out, format="WAV")
+            ):
+                if out is None:
+                    out = sf.SoundFile(out_path, "w", samplerate=sr, channels=1, format="WAV", subtype="PCM_16")
+                out.write(audio)
+        finally:
+            if out is not None:
+                out.close()
         return {"job_type": "narrate", "status": "completed"}
     except Exception as e:
+        try:
+            os.unlink(out_path)
+        except OSError:
+            pass
         return {"job_type": "narrate", "status": "failed", "error": str(e)}
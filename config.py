@@ -7,12 +7,18 @@ AUDIO_CACHE_SIZE = int(os.environ.get("AUDIO_CACHE_SIZE", "10"))
 # Server (Gradio and FastAPI)
 SERVER_NAME = os.environ.get("SERVER_NAME", "0.0.0.0")
 PORT = int(os.environ.get("PORT", "7862"))
+# TTS worker processes, each holding its own loaded model (0 = synthesize in the API process's threadpool)
+TTS_WORKERS = int(os.environ.get("TTS_WORKERS", "0") or "0")
+# With TTS_WORKERS=0: how many syntheses may run at once in the API process (they share one model)
+TTS_INPROCESS_CONCURRENCY = max(1, int(os.environ.get("TTS_INPROCESS_CONCURRENCY", "1") or "1"))
 
 # Voice cloning: where to store .safetensors voice files and metadata (local path for MVP)
 VOICE_STORAGE_PATH = os.environ.get("VOICE_STORAGE_PATH", os.path.join(os.path.dirname(__file__), "voice_storage"))
 # Optional object store: VOICE_STORAGE_BACKEND=local|s3 (default local)
 VOICE_STORAGE_BACKEND = (os.environ.get("VOICE_STORAGE_BACKEND", "local") or "local").lower()
 VOICE_STORAGE_BUCKET = os.environ.get("VOICE_STORAGE_BUCKET", "").strip()
+# Local cache of voice files downloaded from S3 (private to this app, shared by its processes on the host)
+VOICE_S3_CACHE_PATH = os.environ.get("VOICE_S3_CACHE_PATH", os.path.join(VOICE_STORAGE_PATH, ".s3-cache"))
 AWS_REGION = os.environ.get("AWS_REGION", "us-east-1")
 
 # Optional DB for voice metadata (enables audit trail, future per-user voices). SQLite or PostgreSQL URL.
@@ -24,6 +30,9 @@ CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "").strip()
 PENDING_CLONE_PATH = os.environ.get("PENDING_CLONE_PATH", os.path.join(os.path.dirname(__file__), "pending_clones"))
 # Dir for async narrate WAV outputs (must be shared with worker if multi-host)
 NARRATE_RESULT_PATH = os.environ.get("NARRATE_RESULT_PATH", os.path.join(os.path.dirname(__file__), "narrate_results"))
+# Behind nginx: internal location that serves NARRATE_RESULT_PATH (e.g. /_protected_narrate/). When set,
+# GET /jobs/{job_id}/result answers with X-Accel-Redirect so nginx sends the WAV with sendfile.
+NARRATE_ACCEL_REDIRECT_PREFIX = os.environ.get("NARRATE_ACCEL_REDIRECT_PREFIX", "").strip()
 
 # Optional auth: comma-separated API keys (no key required if empty). Header: X-API-Key
 API_KEYS = [k.strip() for k in os.environ.get("API_KEYS", "").split(",") if k.strip()]
@@ -38,6 +47,8 @@ ABUSE_CLONE_PER_IP_PER_HOUR = int(os.environ.get("ABUSE_CLONE_PER_IP_PER_HOUR",
 CLONE_MIN_DURATION_SEC = float(os.environ.get("CLONE_MIN_DURATION_SEC", "3.0"))
 CLONE_MAX_DURATION_SEC = float(os.environ.get("CLONE_MAX_DURATION_SEC", "120.0"))
 CLONE_TARGET_SAMPLE_RATE = 16000
+# Largest accepted audio upload in bytes (clone samples, reference audio); 0 = no limit
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", str(50 * 1024 * 1024)) or "0")
 
 # GDPR: retention (document your policy; delete via DELETE /voices/{voice_id})
 VOICE_RETENTION_DAYS = int(os.environ.get("VOICE_RETENTION_DAYS", "0"))  # 0 = keep until deleted
@@ -46,6 +57,11 @@ VOICE_RETENTION_DAYS = int(os.environ.get("VOICE_RETENTION_DAYS", "0"))  # 0 = k
 RATE_LIMIT_GLOBAL = os.environ.get("RATE_LIMIT_GLOBAL", "60/minute") or None
 RATE_LIMIT_TTS = os.environ.get("RATE_LIMIT_TTS", "30/minute") or None
 RATE_LIMIT_CLONE = os.environ.get("RATE_LIMIT_CLONE", "10/minute") or None
+# Rate limit counter storage. Default is per-process memory; set redis://... to share limits across workers/hosts.
+RATE_LIMIT_REDIS_URL = os.environ.get("RATE_LIMIT_REDIS_URL", "").strip() or "memory://"
+
+# /metrics body is rebuilt in the background every N seconds (0 = build on every scrape)
+METRICS_REFRESH_SEC = float(os.environ.get("METRICS_REFRESH_SEC", "5"))
 
 # CORS: comma-separated origins (e.g. https://app.example.com). Empty = same-origin only.
 CORS_ORIGINS = os.environ.get("CORS_ORIGINS", "").strip()
@@ -6,12 +6,35 @@ Backend: TTS via tts_service.generate(), Co-GM via ai_service.generate_dialogue(
 """
 from __future__ import annotations
 
+import functools
 import html
 import logging
+import re
+import threading
+import time
+from typing import Final
 
 import gradio as gr
 
+from config import TTS_INPROCESS_CONCURRENCY
+
 log = logging.getLogger(__name__)
+# The TTS model is shared in-process: at most TTS_INPROCESS_CONCURRENCY syntheses at once across all handlers
+_tts_slots = threading.BoundedSemaphore(TTS_INPROCESS_CONCURRENCY)
+
+# Backend services are bound once here; handlers check for None instead of importing per click
+try:
+    from tts_service import generate as tts_generate, get_preset_voices, to_pcm16
+    from voice_store import list_voices
+except Exception as e:  # voice dropdowns fall back to the default preset
+    log.warning("Could not import TTS / voice store: %s", e)
+    tts_generate = get_preset_voices = to_pcm16 = list_voices = None
+
+try:
+    from ai_service import generate_dialogue
+except Exception as e:  # e.g. anthropic not installed
+    log.warning("Could not import AI service: %s", e)
+    generate_dialogue = None
 
 # ─── CSS ─────────────────────────────────────────────────────────────────────
 
@@ -59,6 +82,9 @@ body, .gradio-container {
   overflow: hidden;
 }
 
+/* Spacer between static panels fused into one gr.HTML */
+.lb-gap { height: var(--layout-gap, 16px); }
+
 .panel-chrome {
   background: linear-gradient(180deg, #1c1408 0%, #2c2010 50%, #1c1408 100%);
   border-bottom: 1px solid var(--gold);
@@ -530,6 +556,29 @@ textarea.notes-ta:focus { border-color: var(--gold); box-shadow: 0 0 6px var(--g
                     color: var(--gold); letter-spacing: 0.1em; display: block; margin-bottom: 2px; }
 """
 
+
+
+def _minify_css(css: str) -> str:
+    """Strip comments and collapse whitespace (run once at import)."""
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,>])\s*", r"\1", css)
+    css = re.sub(r":\s+", ":", css)  # only after ':' (a space before it is a descendant selector)
+    return css.strip()
+
+
+def _minify_html(markup: str) -> str:
+    """Collapse whitespace between tags to one space (how browsers render it); <script> bodies are left as-is."""
+    return re.sub(
+        r"(<script\b.*?</script>)|>\s+<",
+        lambda m: m.group(1) or "> <",
+        markup,
+        flags=re.S,
+    ).strip()
+
+
+CSS = _minify_css(CSS)
+
 # ─── HTML constants ───────────────────────────────────────────────────────────
 
 HEADER_HTML = """
@@ -674,6 +723,26 @@ CAMPAIGN_BANNER_HTML = """
 </div>
 """
 
+# Initiative order: (name, roll, dot class, row class); the first entry starts as the active turn
+_INITIATIVE = (
+    ("Aethelred",  22, "dot-green",  "on"),
+    ("Beholder",   19, "dot-red",    "enemy"),
+    ("Torin",      17, "dot-green",  ""),
+    ("Mira",       15, "dot-green",  ""),
+    ("Eye Tyrant", 13, "dot-red",    "enemy"),
+    ("Lira",       11, "dot-amber",  ""),
+    ("Zephyr",      6, "dot-red-lt", ""),
+)
+_INIT_ROW_HTML = (
+    '<div class="init-row{row_cls}" onclick="lbSelectInit(this)">'
+    '<span class="init-num">{num}</span><span class="init-roll">{roll}</span>'
+    '<span class="init-name">{name}</span><span class="init-dot {dot_cls}"></span></div>'
+).format
+_INITIATIVE_ROWS_HTML = "".join(
+    _INIT_ROW_HTML(num=i, roll=roll, name=html.escape(name), dot_cls=dot_cls, row_cls=f" {row_cls}" if row_cls else "")
+    for i, (name, roll, dot_cls, row_cls) in enumerate(_INITIATIVE, 1)
+)
+
 ENCOUNTER_TRACKER_HTML = """
 <div class="lb-panel" style="height:260px; display:flex; flex-direction:column;">
   <div class="panel-chrome"><span class="rune">⚔</span> ENCOUNTER TRACKER <span class="rune">⚔</span></div>
@@ -681,34 +750,7 @@ ENCOUNTER_TRACKER_HTML = """
     <div class="init-panel">
       <div class="init-header">⚔ INITIATIVE</div>
       <div class="init-scroll" id="lb_initList">
-        <div class="init-row on" onclick="lbSelectInit(this)">
-          <span class="init-num">1</span><span class="init-roll">22</span>
-          <span class="init-name">Aethelred</span><span class="init-dot dot-green"></span>
-        </div>
-        <div class="init-row enemy" onclick="lbSelectInit(this)">
-          <span class="init-num">2</span><span class="init-roll">19</span>
-          <span class="init-name">Beholder</span><span class="init-dot dot-red"></span>
-        </div>
-        <div class="init-row" onclick="lbSelectInit(this)">
-          <span class="init-num">3</span><span class="init-roll">17</span>
-          <span class="init-name">Torin</span><span class="init-dot dot-green"></span>
-        </div>
-        <div class="init-row" onclick="lbSelectInit(this)">
-          <span class="init-num">4</span><span class="init-roll">15</span>
-          <span class="init-name">Mira</span><span class="init-dot dot-green"></span>
-        </div>
-        <div class="init-row enemy" onclick="lbSelectInit(this)">
-          <span class="init-num">5</span><span class="init-roll">13</span>
-          <span class="init-name">Eye Tyrant</span><span class="init-dot dot-red"></span>
-        </div>
-        <div class="init-row" onclick="lbSelectInit(this)">
-          <span class="init-num">6</span><span class="init-roll">11</span>
-          <span class="init-name">Lira</span><span class="init-dot dot-amber"></span>
-        </div>
-        <div class="init-row" onclick="lbSelectInit(this)">
-          <span class="init-num">7</span><span class="init-roll">6</span>
-          <span class="init-name">Zephyr</span><span class="init-dot dot-red-lt"></span>
-        </div>
+""" + _INITIATIVE_ROWS_HTML + """
       </div>
       <div class="init-controls">
         <button type="button" class="ic-btn next" onclick="lbNextInit()">▶ NEXT</button>
@@ -962,6 +1004,25 @@ WORLD_MAP_HTML = """
 </div>
 """
 
+SESSION_NOTES_CHROME_HTML = '<div class="panel-chrome"><span class="rune">ᛊ</span> SESSION NOTES <span class="rune">ᛊ</span></div>'
+UPDATE_HP_CHROME_HTML = '<div class="panel-chrome" style="font-size:9px;">UPDATE HP</div>'
+CHARACTER_VOICES_CHROME_HTML = '<div class="panel-chrome"><span class="rune">⚔</span> CHARACTER VOICES <span class="rune">⚔</span></div>'
+COGM_CHROME_HTML = '<div class="panel-chrome"><span class="rune">✦</span> CO-GM ASSISTANT <span class="rune">✦</span></div>'
+DIALOGUE_EMPTY_HTML = '<p style="color:var(--ink-faint);font-size:11px;text-align:center;padding:12px;">No dialogue yet.</p>'
+DIALOGUE_CLEARED_HTML = '<p style="color:var(--ink-faint);font-size:11px;text-align:center;padding:12px;">Dialogue cleared.</p>'
+
+HEADER_HTML = _minify_html(HEADER_HTML)
+QUICK_TOOLS_HTML = _minify_html(QUICK_TOOLS_HTML)
+WORLD_MAP_HTML = _minify_html(WORLD_MAP_HTML)
+CAMPAIGN_BANNER_HTML = _minify_html(CAMPAIGN_BANNER_HTML)
+ENCOUNTER_TRACKER_HTML = _minify_html(ENCOUNTER_TRACKER_HTML)
+SPELLBOOK_HTML = _minify_html(SPELLBOOK_HTML)
+
+# Adjacent static panels in the center column, fused into one gr.HTML (one component instead of three)
+CENTER_COLUMN_HTML = '<div class="lb-gap"></div>'.join(
+    (CAMPAIGN_BANNER_HTML, ENCOUNTER_TRACKER_HTML, SPELLBOOK_HTML)
+)
+
 # ─── Backend helpers ──────────────────────────────────────────────────────────
 
 _CHARS = [
@@ -978,103 +1039,144 @@ def _hp_pct(hp: int, max_hp: int) -> float:
     return max(0.0, min(1.0, hp / max_hp)) if max_hp else 0.0
 
 
-def _render_party_roster(hp_vals: dict) -> str:
-    HEART = '<svg viewBox="0 0 24 24" class="heart-icon {cls}" aria-hidden="true"><path d="M12 21.593c-5.63-5.539-11-10.297-11-14.402 0-3.791 3.068-5.191 5.281-5.191 1.312 0 4.151.501 5.719 4.457 1.59-3.968 4.464-4.447 5.726-4.447 2.54 0 5.274 1.621 5.274 5.181 0 4.069-5.136 8.625-11 14.402z"/></svg>'
-    rows = []
-    for c in _CHARS:
-        name = c["name"]
-        hp = int(hp_vals.get(name, c["max"]))
-        pct = _hp_pct(hp, c["max"])
-        if pct > 0.6:
-            card_cls, fill_cls, heart_cls = "", "hp-hi", "heart-red"
-        elif pct > 0.25:
-            card_cls, fill_cls, heart_cls = "hurt", "hp-mid", "heart-amber"
-        else:
-            card_cls, fill_cls, heart_cls = "low", "hp-lo", "heart-dark"
-        border_cls = " gold-border" if c["gold_border"] else ""
-        img_src = f"/static/img/portraits/{c['img']}"
-        fb_url = f"https://api.dicebear.com/9.x/adventurer/svg?seed={name}"
-        rows.append(f"""
+_HEART_SVG = '<svg viewBox="0 0 24 24" class="heart-icon {cls}" aria-hidden="true"><path d="M12 21.593c-5.63-5.539-11-10.297-11-14.402 0-3.791 3.068-5.191 5.281-5.191 1.312 0 4.151.501 5.719 4.457 1.59-3.968 4.464-4.447 5.726-4.447 2.54 0 5.274 1.621 5.274 5.181 0 4.069-5.136 8.625-11 14.402z"/></svg>'
+
+
+# Static per-character row fields, escaped once: (name, max_hp, ac, name_html, class_html, img_src, fallback_url, border_cls)
+_CHAR_ROWS = tuple(
+    (
+        c["name"], c["max"], c["ac"],
+        html.escape(c["name"]), html.escape(c["cls"]),
+        f"/static/img/portraits/{c['img']}",
+        f"https://api.dicebear.com/9.x/adventurer/svg?seed={c['name']}",
+        " gold-border" if c["gold_border"] else "",
+    )
+    for c in _CHARS
+)
+# HP tiers indexed by (pct > 0.25) + (pct > 0.6): (card class, fill class, heart class)
+_HP_TIERS = (
+    ("low", "hp-lo", "heart-dark"),
+    ("hurt", "hp-mid", "heart-amber"),
+    ("", "hp-hi", "heart-red"),
+)
+_PARTY_ROW_HTML = """
 <div class="char-card {card_cls}">
   <div class="portrait-frame{border_cls}">
-    <img src="{img_src}" onerror="this.src='{fb_url}'" class="portrait-img" alt="{html.escape(name)}" />
+    <img src="{img_src}" onerror="this.src='{fb_url}'" class="portrait-img" alt="{name_html}" />
   </div>
   <div class="char-info">
-    <div class="char-name">{html.escape(name)}</div>
-    <div class="char-class">{html.escape(c['cls'])}</div>
+    <div class="char-name">{name_html}</div>
+    <div class="char-class">{class_html}</div>
     <div class="char-status">
-      <span class="status-icon">{HEART.format(cls=heart_cls)}</span>
-      <span class="status-badge sb-hp">{hp}/{c['max']}</span>
-      <span class="status-badge sb-ac">AC {c['ac']}</span>
+      <span class="status-icon">{heart}</span>
+      <span class="status-badge sb-hp">{hp}/{max_hp}</span>
+      <span class="status-badge sb-ac">AC {ac}</span>
     </div>
-    <div class="hp-track"><div class="hp-fill {fill_cls}" style="width:{pct*100:.0f}%"></div></div>
+    <div class="hp-track"><div class="hp-fill {fill_cls}" style="width:{pct:.0f}%"></div></div>
   </div>
-</div>""")
+</div>""".format
+_HEARTS = {heart_cls: _HEART_SVG.format(cls=heart_cls) for _, _, heart_cls in _HP_TIERS}
+
+
+def _render_party_roster(hp_vals: dict) -> str:
+    rows = []
+    for name, max_hp, ac, name_html, class_html, img_src, fb_url, border_cls in _CHAR_ROWS:
+        hp = int(hp_vals.get(name, max_hp))
+        pct = _hp_pct(hp, max_hp)
+        card_cls, fill_cls, heart_cls = _HP_TIERS[(pct > 0.25) + (pct > 0.6)]
+        rows.append(_PARTY_ROW_HTML(
+            card_cls=card_cls, border_cls=border_cls, img_src=img_src, fb_url=fb_url,
+            name_html=name_html, class_html=class_html, heart=_HEARTS[heart_cls],
+            hp=hp, max_hp=max_hp, ac=ac, fill_cls=fill_cls, pct=pct * 100,
+        ))
     return (
         '<div class="panel-chrome"><span class="rune">ᚨ</span> PARTY ROSTER <span class="rune">ᚨ</span></div>'
         '<div class="roster-scroll">' + "".join(rows) + "</div>"
     )
 
 
+# Indexed by "is assistant": GM line, NPC line
+_DIALOGUE_ENTRY_HTML = (
+    '<div class="dialogue-entry dialogue-gm"><span class="dialogue-speaker">GM</span>{}</div>',
+    '<div class="dialogue-entry dialogue-npc"><span class="dialogue-speaker">NPC</span>{}</div>',
+)
+
+
+_ROLE_ASSISTANT: Final = "assistant"
+
+
 def _render_dialogue_log(history: list) -> str:
     if not history:
-        return '<p style="color:var(--ink-faint);font-size:11px;text-align:center;padding:12px;">No dialogue yet.</p>'
-    parts = []
-    for msg in history[-10:]:  # show last 10 turns
-        role = msg.get("role", "assistant")
-        content = html.escape(msg.get("content", ""))
-        if role == "assistant":
-            parts.append(
-                f'<div class="dialogue-entry dialogue-npc">'
-                f'<span class="dialogue-speaker">NPC</span>{content}</div>'
-            )
-        else:
-            parts.append(
-                f'<div class="dialogue-entry dialogue-gm">'
-                f'<span class="dialogue-speaker">GM</span>{content}</div>'
-            )
-    return "".join(parts)
+        return DIALOGUE_EMPTY_HTML
+    return "".join(
+        _DIALOGUE_ENTRY_HTML[msg.get("role", _ROLE_ASSISTANT) == _ROLE_ASSISTANT].format(html.escape(msg.get("content", "")))
+        for msg in history[-10:]  # show last 10 turns
+    )
+
+
+# 'Name [voice_id]' / 'name [preset]'
+_VOICE_CHOICE_RE = re.compile(r"^(?P<name>.*?)\s*\[(?P<id>[^\[]*)\]$")
 
 
 def _parse_voice_choice(choice: str | None) -> str | None:
-    """Extract voice_id from 'Name [voice_id]' format, or return None for default."""
-    if choice and "[" in choice and choice.endswith("]"):
-        return choice.split("[")[-1].rstrip("]").strip()
-    return choice or None
+    """Extract voice_id from 'Name [voice_id]' (preset name for 'name [preset]'), or return None for default."""
+    if not choice:
+        return None
+    m = _VOICE_CHOICE_RE.match(choice)
+    if m is None:
+        return choice
+    voice_id = m["id"].strip()
+    return (m["name"].strip() if voice_id == "preset" else voice_id) or None
+
+
+# Voice choices are reused for this many seconds (refresh clicks and page loads within the window share one scan)
+_VOICE_CHOICES_TTL_SEC = 5
+
+
+# Preset voices never change at runtime; only the cloned-voice part of the list is rescanned
+_PRESET_CHOICES: Final = tuple(f"{v} [preset]" for v in get_preset_voices()) if get_preset_voices else ("alba [preset]",)
+
+
+@functools.lru_cache(maxsize=4)
+def _voice_choices_cached(bucket: int) -> tuple[str, ...]:
+    return _PRESET_CHOICES + tuple(f"{v['name']} [{v['voice_id']}]" for v in list_voices())
 
 
 def _get_voice_choices() -> list[str]:
     try:
-        from tts_service import get_preset_voices
-        from voice_store import list_voices
-        presets = [f"{v} [preset]" for v in get_preset_voices()]
-        cloned  = [f"{v['name']} [{v['voice_id']}]" for v in list_voices()]
-        return presets + cloned
+        if list_voices is None:
+            raise RuntimeError("voice store unavailable")
+        return list(_voice_choices_cached(int(time.monotonic() // _VOICE_CHOICES_TTL_SEC)))
     except Exception as e:
         log.warning("Could not load voices: %s", e)
-        return ["alba [preset]"]
+        return list(_PRESET_CHOICES)
+
+
+# Roster at default HP, rendered once for the initial page
+_PARTY_ROSTER_DEFAULT_HTML = _render_party_roster(_CHAR_DEFAULT_HP)
 
 
 # ─── Gradio event handlers ────────────────────────────────────────────────────
 
-def refresh_voices() -> list[str]:
-    return _get_voice_choices()
+def refresh_voices() -> tuple:
+    """Refresh both voice dropdowns (TTS panel and Co-GM) from one voice list."""
+    update = gr.update(choices=_get_voice_choices())
+    return update, update
 
 
 def speak_line(text: str, voice_choice: str) -> tuple:
-    text = (text or "").strip()
-    if not text:
+    # Empty input is rejected before stripping; str.strip() returns the same object when already trimmed
+    if not text or not (text := text.strip()):
         raise gr.Error("Enter some text to speak.")
     voice_id = _parse_voice_choice(voice_choice)
     if not voice_id:
         raise gr.Error("Select a voice first.")
-    # Strip '[preset]' suffix for preset voices
-    if voice_id == "preset":
-        voice_id = voice_choice.split("[")[0].strip()
+    if tts_generate is None:
+        raise gr.Error("TTS is unavailable on this server.")
     try:
-        from tts_service import generate as tts_generate
-        arr, sr = tts_generate(text, speaker_emb_path=voice_id)
-        return (sr, arr)
+        with _tts_slots:
+            arr, sr = tts_generate(text, speaker_emb_path=voice_id)
+        return (sr, to_pcm16(arr))  # int16 so gr.Audio encodes the WAV without converting
     except ValueError as e:
         raise gr.Error(str(e)) from e
     except RuntimeError as e:
@@ -1088,35 +1190,33 @@ def cogm_generate(
     history: list,
     voice_choice: str,
 ) -> tuple:
-    npc_name = (npc_name or "").strip()
-    personality = (personality or "").strip()
-    situation = (situation or "").strip()
-    if not npc_name:
+    if not npc_name or not (npc_name := npc_name.strip()):
         raise gr.Error("Enter an NPC name.")
-    if not personality:
+    if not personality or not (personality := personality.strip()):
         raise gr.Error("Enter NPC personality notes.")
-    if not situation:
+    if not situation or not (situation := situation.strip()):
         raise gr.Error("Describe the current situation.")
 
+    if generate_dialogue is None:
+        raise gr.Error("Co-GM is unavailable: the AI service could not be loaded.")
     try:
-        from ai_service import generate_dialogue
         dialogue = generate_dialogue(npc_name, personality, situation, history)
     except RuntimeError as e:
         raise gr.Error(str(e)) from e
 
-    new_history = (history or []) + [{"role": "assistant", "content": dialogue}]
-    new_history = new_history[-20:]
+    # gr.State holds this list per session, so extend it in place rather than copying each turn
+    new_history = history if history is not None else []
+    new_history.append({"role": _ROLE_ASSISTANT, "content": dialogue})
+    del new_history[:-20]  # keep last 20
 
     # TTS for the dialogue
     voice_id = _parse_voice_choice(voice_choice)
     audio_out = None
-    if voice_id:
-        if voice_id == "preset":
-            voice_id = voice_choice.split("[")[0].strip()
+    if voice_id and tts_generate is not None:
         try:
-            from tts_service import generate as tts_generate
-            arr, sr = tts_generate(dialogue, speaker_emb_path=voice_id)
-            audio_out = (sr, arr)
+            with _tts_slots:
+                arr, sr = tts_generate(dialogue, speaker_emb_path=voice_id)
+            audio_out = (sr, to_pcm16(arr))
         except Exception as e:
             log.warning("Co-GM TTS failed: %s", e)
 
@@ -1124,7 +1224,7 @@ def cogm_generate(
 
 
 def cogm_clear() -> tuple:
-    return '<p style="color:var(--ink-faint);font-size:11px;text-align:center;padding:12px;">Dialogue cleared.</p>', [], None
+    return DIALOGUE_CLEARED_HTML, [], None
 
 
 def hp_changed(a: float, li: float, t: float, z: float, m: float) -> tuple:
@@ -1150,6 +1250,7 @@ with gr.Blocks(
 ) as demo:
 
     gr.HTML(HEADER_HTML)
+    voice_choices = _get_voice_choices()  # shared by both voice dropdowns
 
     with gr.Row(equal_height=False):
 
@@ -1157,7 +1258,7 @@ with gr.Blocks(
         with gr.Column(scale=1, min_width=220):
             gr.HTML(QUICK_TOOLS_HTML)
             with gr.Group(elem_classes="lb-panel lb-section"):
-                gr.HTML('<div class="panel-chrome"><span class="rune">ᛊ</span> SESSION NOTES <span class="rune">ᛊ</span></div>')
+                gr.HTML(SESSION_NOTES_CHROME_HTML)
                 notes_ta = gr.Textbox(
                     lines=8,
                     placeholder="Scribe your notes here…",
@@ -1172,17 +1273,15 @@ with gr.Blocks(
 
         # ── Center column: Banner + Encounter + Spellbook ─────
         with gr.Column(scale=2, min_width=380):
-            gr.HTML(CAMPAIGN_BANNER_HTML)
-            gr.HTML(ENCOUNTER_TRACKER_HTML)
-            gr.HTML(SPELLBOOK_HTML)
+            gr.HTML(CENTER_COLUMN_HTML)
 
         # ── Right column: Party Roster + World Map ────────────
         with gr.Column(scale=1, min_width=240):
             party_state = gr.State(dict(_CHAR_DEFAULT_HP))
-            party_html  = gr.HTML(_render_party_roster(_CHAR_DEFAULT_HP))
+            party_html  = gr.HTML(_PARTY_ROSTER_DEFAULT_HTML)
 
             with gr.Group(elem_classes="lb-panel lb-section"):
-                gr.HTML('<div class="panel-chrome" style="font-size:9px;">UPDATE HP</div>')
+                gr.HTML(UPDATE_HP_CHROME_HTML)
                 with gr.Row():
                     hp_aeth = gr.Number(value=_CHAR_DEFAULT_HP["Aethelred"], label="Aethelred",
                                         precision=0, minimum=0, maximum=80, elem_classes="lb-section")
@@ -1203,10 +1302,10 @@ with gr.Blocks(
     with gr.Row(equal_height=False):
 
         with gr.Column(scale=1, elem_classes="lb-panel lb-section"):
-            gr.HTML('<div class="panel-chrome"><span class="rune">⚔</span> CHARACTER VOICES <span class="rune">⚔</span></div>')
+            gr.HTML(CHARACTER_VOICES_CHROME_HTML)
             with gr.Row():
                 voice_dd    = gr.Dropdown(
-                    choices=_get_voice_choices(),
+                    choices=voice_choices,
                     label="Voice",
                     scale=3,
                     elem_classes="lb-section",
@@ -1222,11 +1321,11 @@ with gr.Blocks(
                 tts_audio = gr.Audio(type="numpy", label="Output", autoplay=True)
 
         with gr.Column(scale=1, elem_classes="lb-panel lb-section"):
-            gr.HTML('<div class="panel-chrome"><span class="rune">✦</span> CO-GM ASSISTANT <span class="rune">✦</span></div>')
+            gr.HTML(COGM_CHROME_HTML)
             with gr.Row():
                 npc_name   = gr.Textbox(label="NPC Name", scale=1, elem_classes="lb-section")
                 cogm_voice = gr.Dropdown(
-                    choices=_get_voice_choices(),
+                    choices=voice_choices,
                     label="Voice",
                     scale=1,
                     elem_classes="lb-section",
@@ -1237,29 +1336,38 @@ with gr.Blocks(
                 gen_btn   = gr.Button("⚔ Speak as NPC", variant="primary", elem_classes="lb-btn lb-btn-primary")
                 clear_btn = gr.Button("Clear", variant="secondary",         elem_classes="lb-btn")
             history_state = gr.State([])
-            dialogue_log  = gr.HTML(
-                '<p style="color:var(--ink-faint);font-size:11px;text-align:center;padding:12px;">No dialogue yet.</p>'
-            )
+            dialogue_log  = gr.HTML(DIALOGUE_EMPTY_HTML)
             cogm_audio = gr.Audio(type="numpy", label="NPC Voice", autoplay=True)
 
     # ── Event wiring ──────────────────────────────────────────
-    speak_btn.click(speak_line, [tts_text, voice_dd], tts_audio)
-    refresh_btn.click(refresh_voices, [], voice_dd)
+    # UI-only events: no API endpoint, and no progress overlay except on the slow TTS / AI calls
+    _ui = {"api_visibility": "private", "show_progress": "hidden"}
+    _slow = {**_ui, "show_progress": "minimal"}
+
+    speak_btn.click(speak_line, [tts_text, voice_dd], tts_audio, concurrency_limit=TTS_INPROCESS_CONCURRENCY, **_slow)
+    refresh_btn.click(refresh_voices, [], [voice_dd, cogm_voice], **_ui)
 
     gen_btn.click(
         cogm_generate,
         [npc_name, personality, situation, history_state, cogm_voice],
         [dialogue_log, history_state, cogm_audio],
+        # The AI call dominates and can overlap; its TTS step still waits for a _tts_slots slot
+        concurrency_limit=8,
+        **_slow,
     )
-    clear_btn.click(cogm_clear, [], [dialogue_log, history_state, cogm_audio])
+    clear_btn.click(cogm_clear, [], [dialogue_log, history_state, cogm_audio], **_ui)
 
     hp_inputs = [hp_aeth, hp_lira, hp_tor, hp_zeph, hp_mira]
     for hp_inp in hp_inputs:
-        hp_inp.change(hp_changed, hp_inputs, [party_html, party_state])
+        hp_inp.change(hp_changed, hp_inputs, [party_html, party_state], **_ui)
 
     def _tag_insert(notes, tag):
         return notes + f"\n{tag}: "
 
-    quest_btn.click(_tag_insert,  [notes_ta, gr.State("QUEST")],  notes_ta)
-    danger_btn.click(_tag_insert, [notes_ta, gr.State("DANGER")], notes_ta)
-    lore_btn.click(_tag_insert,   [notes_ta, gr.State("LORE")],   notes_ta)
+    quest_btn.click(_tag_insert,  [notes_ta, gr.State("QUEST")],  notes_ta, **_ui)
+    danger_btn.click(_tag_insert, [notes_ta, gr.State("DANGER")], notes_ta, **_ui)
+    lore_btn.click(_tag_insert,   [notes_ta, gr.State("LORE")],   notes_ta, **_ui)
+
+# Handlers are sync and run in Gradio's worker threads; events keep Gradio's default of one call at a time
+# except the Co-GM AI call (see gen_btn), and TTS stays bounded by the shared model
+demo.queue(max_size=64)
@@ -1,12 +1,18 @@
 """
 Structured logging for JSON output (e.g. for production log aggregation).
 Set LOG_JSON=1 to enable JSON format; otherwise use default format.
+Records are handed to a background QueueListener so formatting and I/O stay off the request path.
 """
 import json
 import logging
 import os
+import queue
 import sys
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
 
 
 class JsonFormatter(logging.Formatter):
@@ -14,7 +20,7 @@ class JsonFormatter(logging.Formatter):
 
     def format(self, record: logging.LogRecord) -> str:
         log = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -34,15 +40,49 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(log)
 
 
+class _InProcessQueueHandler(QueueHandler):
+    """QueueHandler for an in-process queue: keeps exc_info and extra fields for the real formatter."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
 def configure_logging() -> None:
-    """Configure root logger: JSON if LOG_JSON=1, else default."""
+    """Configure root logger: JSON if LOG_JSON=1, else default. Output goes through a background listener."""
+    global _listener
     use_json = os.environ.get("LOG_JSON", "").strip() in ("1", "true", "yes")
     root = logging.getLogger()
-    if not root.handlers:
-        handler = logging.StreamHandler(sys.stderr)
-        handler.setFormatter(JsonFormatter() if use_json else logging.Formatter(
-            "%(asctime)s %(levelname)s [%(name)s] %(message)s"
-        ))
-        root.addHandler(handler)
+    if _listener is None:
+        # Never wrap our own queue handler (e.g. one left over from an earlier configure)
+        handlers = [h for h in root.handlers if not isinstance(h, QueueHandler)]
+        if not handlers:
+            handler = logging.StreamHandler(sys.stderr)
+            handler.setFormatter(JsonFormatter() if use_json else logging.Formatter(
+                "%(asctime)s %(levelname)s [%(name)s] %(message)s"
+            ))
+            handlers = [handler]
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        for h in list(root.handlers):
+            root.removeHandler(h)
+        root.addHandler(_InProcessQueueHandler(log_queue))
+        _listener.start()
     level = os.environ.get("LOG_LEVEL", "INFO").upper()
     root.setLevel(getattr(logging, level, logging.INFO))
+
+
+def stop_logging() -> None:
+    """Flush queued records and stop the background listener (call on shutdown)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        # Detach the queue handler (nothing reads its queue any more) and log directly again
+        root = logging.getLogger()
+        for h in list(root.handlers):
+            if isinstance(h, _InProcessQueueHandler):
+                root.removeHandler(h)
+        for h in _listener.handlers:
+            root.addHandler(h)
+        _listener = None
@@ -2,6 +2,7 @@
 In-memory metrics for Prometheus-style /metrics endpoint.
 Counters: tts_requests_total, clone_requests_total, errors_total.
 Request duration: http_request_duration_seconds (summary: sum + count per path).
+Counters are accumulated per thread without locking and summed at collection time.
 """
 import threading
 from typing import List, Tuple
@@ -18,10 +19,37 @@ _lock = threading.Lock()
 _duration_sum: dict[str, float] = {}
 _duration_count: dict[str, int] = {}
 
+# Per-thread counter slots (only the owning thread writes; collection reads a copy)
+_local = threading.local()
+_local_slots: list[dict[str, int]] = []
+
+
+def _local_counts() -> dict[str, int]:
+    counts = getattr(_local, "counts", None)
+    if counts is None:
+        counts = {}
+        with _lock:
+            _local_slots.append(counts)
+        _local.counts = counts
+    return counts
+
 
 def increment(name: str, value: int = 1) -> None:
+    """Add to a counter. Lock-free: writes go to this thread's slot."""
     if name in _metrics:
-        _metrics[name] += value
+        counts = _local_counts()
+        counts[name] = counts.get(name, 0) + value
+
+
+def _collect_counters() -> dict[str, int]:
+    """Sum all per-thread slots into one name -> value map."""
+    totals = dict(_metrics)
+    with _lock:
+        slots = list(_local_slots)
+    for counts in slots:
+        for name, value in counts.copy().items():
+            totals[name] += value
+    return totals
 
 
 def record_request_duration(path: str, duration_seconds: float) -> None:
@@ -32,13 +60,13 @@ def record_request_duration(path: str, duration_seconds: float) -> None:
 
 
 def get_all() -> List[Tuple[str, int]]:
-    return list(_metrics.items())
+    return list(_collect_counters().items())
 
 
 def prometheus_text() -> str:
     """Return metrics in Prometheus exposition format (text)."""
     lines = []
-    for name, value in _metrics.items():
+    for name, value in _collect_counters().items():
         lines.append(f"# HELP {name} Counter")
         lines.append(f"# TYPE {name} counter")
         lines.append(f"{name} {value}")
@@ -10,21 +10,32 @@ try:
 except ImportError:
     pass
 
-import io
+import asyncio
+import base64
+import functools
+import hashlib
+import json
 import logging
+import multiprocessing
 import os
+import struct
 import time
 import tempfile
+import threading
 import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
-import soundfile as sf
 from fastapi import Depends, FastAPI, File, Form, Header, HTTPException, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 from pathlib import Path
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse, Response, StreamingResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
@@ -39,66 +50,194 @@ from config import (
     CELERY_BROKER_URL,
     CORS_ORIGINS,
     HF_TOKEN,
+    NARRATE_ACCEL_REDIRECT_PREFIX,
     NARRATE_RESULT_PATH,
     PENDING_CLONE_PATH,
     PORT,
     MAX_ADVENTURE_CHARS,
+    MAX_UPLOAD_BYTES,
+    METRICS_REFRESH_SEC,
     RATE_LIMIT_AI,
     RATE_LIMIT_CLONE,
     RATE_LIMIT_GLOBAL,
     RATE_LIMIT_PARSE,
+    RATE_LIMIT_REDIS_URL,
     RATE_LIMIT_TTS,
     REQUIRE_API_KEY,
     SERVER_NAME,
+    TTS_INPROCESS_CONCURRENCY,
+    TTS_WORKERS,
 )
-from logging_config import configure_logging
+from logging_config import configure_logging, stop_logging
 from metrics import increment, prometheus_text, record_request_duration
 from text_utils import MAX_CHUNKS, MAX_TOTAL_CHARS, split_for_tts
-from tts_service import generate as tts_generate, get_preset_voices, get_supported_language_tags, _is_preset_voice
+from tts_service import generate as tts_generate, get_preset_voices, get_supported_language_tags, is_model_loaded, to_pcm16, warm_up, _is_preset_voice
 from voice_clone import clone_voice
 from voice_store import delete_voice, get_metadata, list_voices, load_embedding_path, update_metadata
 
-def _lang_tags():
-    """Preset accents from the loaded model (or default list)."""
-    return get_supported_language_tags()
+# Supported tags are fixed for the process (not model-dependent), so they are read once
+_LANG_TAGS = tuple(get_supported_language_tags())
+_SUPPORTED_LANG_TAGS = frozenset(_LANG_TAGS)
+_DEFAULT_LANG_TAG = (_LANG_TAGS or ("en",))[0]
+
+
+def _normalize_lang_tag(tag: Optional[str]) -> str:
+    """Return tag (default "en") if supported by the engine, else the first supported tag."""
+    tag = (tag or "").strip() or "en"
+    if tag in _SUPPORTED_LANG_TAGS or not _SUPPORTED_LANG_TAGS:
+        return tag
+    return _DEFAULT_LANG_TAG
+
+
+# TTS worker processes (TTS_WORKERS > 0), started on app startup; each loads the model once in its initializer
+_tts_pool: Optional[ProcessPoolExecutor] = None
+# One warm-up task per worker (submitting them is what spawns the processes) and a shared count of
+# workers whose initializer finished loading the model; /ready waits on both.
+_tts_pool_warmups: list[Future] = []
+_tts_pool_loaded = None
+
+# In-flight TTS calls keyed by their full input; identical concurrent requests share one synthesis.
+_tts_inflight: dict[tuple, asyncio.Future] = {}
+# Bounds in-process synthesis (no worker pool) so concurrent requests don't all run on the one model at once
+_tts_inprocess_sem = asyncio.Semaphore(TTS_INPROCESS_CONCURRENCY)
+
+
+async def _run_tts_inprocess(call):
+    async with _tts_inprocess_sem:
+        return await run_in_threadpool(call)
+
+
+def _tts_inflight_done(key: tuple, fut: asyncio.Future) -> None:
+    _tts_inflight.pop(key, None)
+    if not fut.cancelled():
+        fut.exception()  # mark retrieved even if every waiter went away
+
+
+async def _tts_generate_shared(
+    text: str,
+    language_tag: str,
+    speaker_emb_path: Optional[str],
+    temperature: float = 0.65,
+    top_p: float = 0.80,
+    repetition_penalty: float = 1.15,
+):
+    """Run tts_generate in the TTS worker pool (or threadpool), joining an identical in-flight call if there is one."""
+    key = (text, language_tag, speaker_emb_path, temperature, top_p, repetition_penalty)
+    fut = _tts_inflight.get(key)
+    if fut is None:
+        call = functools.partial(
+            tts_generate,
+            text,
+            language_tag=language_tag,
+            speaker_emb_path=speaker_emb_path,
+            temperature=temperature,
+            top_p=top_p,
+            repetition_penalty=repetition_penalty,
+        )
+        if _tts_pool is not None:
+            fut = asyncio.get_running_loop().run_in_executor(_tts_pool, call)
+        else:
+            fut = asyncio.ensure_future(_run_tts_inprocess(call))
+        _tts_inflight[key] = fut
+        fut.add_done_callback(lambda f: _tts_inflight_done(key, f))
+    # shield: a disconnecting client must not cancel synthesis other requests are waiting on
+    return await asyncio.shield(fut)
+
+
+# voice_id -> (expires_at, path). Deletes here invalidate; the short TTL bounds deletes made by other processes
+# (on S3 it stacks on voice_store's revalidation window), and a path whose file is gone is looked up again.
+_EMB_PATH_TTL_SEC = 5.0
+_EMB_PATH_CACHE_MAX = 10_000
+_emb_path_cache: dict[str, tuple[float, str]] = {}
+_emb_path_lock = threading.Lock()
+
+
+def _cached_embedding_path(voice_id: str) -> Optional[str]:
+    """load_embedding_path with a short in-process TTL cache (misses are not cached)."""
+    now = time.monotonic()
+    with _emb_path_lock:
+        hit = _emb_path_cache.get(voice_id)
+    if hit is not None and hit[0] > now:
+        if os.path.exists(hit[1]):
+            return hit[1]
+        # Deleted or evicted from the S3 file cache since it was cached
+        _invalidate_embedding_path(voice_id)
+    path = load_embedding_path(voice_id)
+    if path:
+        with _emb_path_lock:
+            if voice_id not in _emb_path_cache and len(_emb_path_cache) >= _EMB_PATH_CACHE_MAX:
+                _emb_path_cache.pop(next(iter(_emb_path_cache)))
+            _emb_path_cache[voice_id] = (now + _EMB_PATH_TTL_SEC, path)
+    return path
+
+
+def _invalidate_embedding_path(voice_id: str) -> None:
+    with _emb_path_lock:
+        _emb_path_cache.pop(voice_id, None)
 
 
 # Optional API key verification (when REQUIRE_API_KEY and API_KEYS are set)
+_API_KEYS = frozenset(API_KEYS)
+
+
+def _request_api_key(request: Request) -> str:
+    """API key from X-API-Key, else from Authorization (with or without a "Bearer " prefix)."""
+    key = request.headers.get("X-API-Key")
+    if key:
+        return key
+    auth = request.headers.get("Authorization") or ""
+    return (auth[7:] if auth.startswith("Bearer ") else auth).strip()
+
+
 async def verify_api_key(request: Request) -> None:
-    if not REQUIRE_API_KEY or not API_KEYS:
+    if not REQUIRE_API_KEY or not _API_KEYS:
         return
-    key = request.headers.get("X-API-Key") or (request.headers.get("Authorization") or "").replace("Bearer ", "").strip()
-    if not key or key not in API_KEYS:
+    if _request_api_key(request) not in _API_KEYS:
         raise HTTPException(401, "Invalid or missing API key")
 
 
 def get_owner_id(request: Request) -> Optional[str]:
     """Resolve owner from request: valid API key or None. Used for per-user voice scoping when DB is set."""
-    if not API_KEYS:
+    if not _API_KEYS:
         return None
-    key = request.headers.get("X-API-Key") or (request.headers.get("Authorization") or "").replace("Bearer ", "").strip()
-    return key if key in API_KEYS else None
+    key = _request_api_key(request)
+    return key if key in _API_KEYS else None
+
+
+# Abuse: clone count per IP (in-memory, last hour). Deques are capped at the limit; empty ones are swept.
+_CLONE_WINDOW_SEC = 3600
+_CLONE_SWEEP_SEC = 300
+_clone_times_by_ip: dict[str, deque[float]] = {}
+_clone_times_lock = threading.Lock()
+_clone_last_sweep = 0.0
 
 
-# Abuse: clone count per IP (in-memory, last hour)
-_clone_times_by_ip: dict[str, list[float]] = {}
 def _check_abuse_clone(ip: str) -> None:
+    global _clone_last_sweep
     if ABUSE_CLONE_PER_IP_PER_HOUR <= 0:
         return
-    now = time.time()
-    cutoff = now - 3600
-    if ip not in _clone_times_by_ip:
-        _clone_times_by_ip[ip] = []
-    times = _clone_times_by_ip[ip]
-    times.append(now)
-    times[:] = [t for t in times if t > cutoff]
-    if len(times) > ABUSE_CLONE_PER_IP_PER_HOUR:
-        raise HTTPException(429, "Too many voice clones from this IP; try again later")
+    now = time.monotonic()
+    cutoff = now - _CLONE_WINDOW_SEC
+    with _clone_times_lock:
+        if now - _clone_last_sweep >= _CLONE_SWEEP_SEC:
+            _clone_last_sweep = now
+            for stale in [k for k, d in _clone_times_by_ip.items() if not d or d[-1] <= cutoff]:
+                del _clone_times_by_ip[stale]
+        times = _clone_times_by_ip.get(ip)
+        if times is None:
+            times = _clone_times_by_ip[ip] = deque(maxlen=ABUSE_CLONE_PER_IP_PER_HOUR)
+        while times and times[0] <= cutoff:
+            times.popleft()
+        if len(times) >= ABUSE_CLONE_PER_IP_PER_HOUR:
+            raise HTTPException(429, "Too many voice clones from this IP; try again later")
+        times.append(now)
 
 
 limiter = Limiter(
     key_func=get_remote_address,
     application_limits=[RATE_LIMIT_GLOBAL] if RATE_LIMIT_GLOBAL else [],
+    storage_uri=RATE_LIMIT_REDIS_URL,
+    strategy="moving-window",
 )
 app = FastAPI(title="Kani TTS API")
 app.state.limiter = limiter
@@ -111,6 +250,23 @@ if CORS_ORIGINS:
         app.add_middleware(CORSMiddleware, allow_origins=origins, allow_credentials=False, allow_methods=["*"], allow_headers=["*"])
 
 
+# Audio (/tts, /tts/narrate, /jobs/{id}/result) barely compresses and job event streams must not be buffered
+_GZIP_SKIP_PREFIXES = ("/tts", "/jobs/")
+
+
+class _SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip for pages, JSON and /metrics; skips the audio and streaming routes."""
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].startswith(_GZIP_SKIP_PREFIXES):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+app.add_middleware(_SelectiveGZipMiddleware, minimum_size=2048)
+
+
 @app.middleware("http")
 async def request_logging_and_metrics(request: Request, call_next):
     """Log request path/status/duration and record latency for /metrics."""
@@ -146,47 +302,155 @@ def startup():
     if not ANTHROPIC_API_KEY:
         logging.warning("ANTHROPIC_API_KEY is not set. POST /ai/dialogue will return 500; add it to .env for Co-GM features.")
 
+
+# Prometheus text, rebuilt by _metrics_refresher so scrapes only send bytes (None = not started)
+_metrics_body: Optional[bytes] = None
+_metrics_task: Optional[asyncio.Task] = None
+
+
+async def _metrics_refresher():
+    global _metrics_body
+    while True:
+        _metrics_body = prometheus_text().encode("utf-8")
+        await asyncio.sleep(METRICS_REFRESH_SEC)
+
+
+@app.on_event("startup")
+async def start_metrics_refresher():
+    global _metrics_task
+    if METRICS_REFRESH_SEC > 0:
+        _metrics_task = asyncio.create_task(_metrics_refresher())
+
+
+@app.on_event("startup")
+def start_tts_pool():
+    global _tts_pool, _tts_pool_warmups, _tts_pool_loaded
+    if TTS_WORKERS > 0:
+        # spawn: workers must not inherit the API process's threads or a half-initialized torch
+        ctx = multiprocessing.get_context("spawn")
+        _tts_pool_loaded = ctx.Value("i", 0)
+        _tts_pool = ProcessPoolExecutor(
+            max_workers=TTS_WORKERS,
+            mp_context=ctx,
+            initializer=warm_up,
+            initargs=(_tts_pool_loaded,),
+        )
+        # The executor starts no processes until work is submitted; start (and load) them all now
+        _tts_pool_warmups = [_tts_pool.submit(is_model_loaded) for _ in range(TTS_WORKERS)]
+        logging.info("TTS worker pool starting %d processes.", TTS_WORKERS)
+
+
+def _tts_pool_ready() -> bool:
+    """True once every worker has loaded the model; raises if any warm-up failed (e.g. broken pool)."""
+    for fut in _tts_pool_warmups:
+        if not fut.done():
+            return False
+        fut.result()
+    return _tts_pool_loaded is not None and _tts_pool_loaded.value >= TTS_WORKERS
+
+
+@app.on_event("shutdown")
+def shutdown():
+    if _metrics_task is not None:
+        _metrics_task.cancel()
+    if _tts_pool is not None:
+        _tts_pool.shutdown(wait=False, cancel_futures=True)
+    stop_logging()
+
+# --- Static JSON bodies (config, limits and preset voices do not change at runtime) ---
+def _json_bytes(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+_CONFIG_JSON = _json_bytes({"require_api_key": REQUIRE_API_KEY})
+_HEALTH_JSON = _json_bytes({"status": "ok", "service": "kani-tts"})
+_READY_JSON = _json_bytes({"status": "ready"})
+_LIMITS_JSON = _json_bytes({"max_narrate_chars": MAX_TOTAL_CHARS, "max_narrate_chunks": MAX_CHUNKS})
+_VOICES_JSON = _json_bytes({"language_tags": list(_LANG_TAGS), "preset_voices": get_preset_voices()})
+
 # --- Client config (e.g. whether API key is required) ---
 @app.get("/config")
 def get_config():
     """Return client config so the frontend can show API key input when required."""
-    return {"require_api_key": REQUIRE_API_KEY}
+    return Response(_CONFIG_JSON, media_type="application/json")
 
 # --- Health and readiness ---
 @app.get("/health")
 def health():
-    return {"status": "ok", "service": "kani-tts"}
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
 @app.get("/ready")
 def ready():
     """Readiness: 503 until TTS model has been loaded (e.g. after first request). Use for load balancer readiness probe."""
-    from tts_service import is_model_loaded
-    if not is_model_loaded():
+    if _tts_pool is not None:
+        # The model lives in the workers: ready only when all of them have loaded it
+        try:
+            pool_ready = _tts_pool_ready()
+        except Exception as e:
+            raise HTTPException(503, f"TTS worker pool failed to start: {e!s}")
+        if not pool_ready:
+            raise HTTPException(503, "Model not yet loaded")
+    elif not is_model_loaded():
         raise HTTPException(503, "Model not yet loaded")
-    return {"status": "ready"}
+    return Response(_READY_JSON, media_type="application/json")
 
 # --- Metrics (Prometheus-style) ---
 @app.get("/metrics")
-def metrics():
-    return PlainTextResponse(prometheus_text(), media_type="text/plain; charset=utf-8")
+async def metrics():
+    body = _metrics_body if _metrics_body is not None else prometheus_text().encode("utf-8")
+    return Response(body, media_type="text/plain; charset=utf-8")
 
 # --- Limits (for frontend) ---
 @app.get("/limits")
 def limits():
     """Return narrate limits so the frontend can show counters and disable submit without duplicating constants."""
-    return {"max_narrate_chars": MAX_TOTAL_CHARS, "max_narrate_chunks": MAX_CHUNKS}
+    return Response(_LIMITS_JSON, media_type="application/json")
 
 # --- Voices (preset list + language) ---
 @app.get("/voices")
 def voices():
-    return {"language_tags": _lang_tags(), "preset_voices": get_preset_voices()}
+    return Response(_VOICES_JSON, media_type="application/json")
 
 def _use_clone_queue() -> bool:
     return bool(CELERY_BROKER_URL and not CELERY_BROKER_URL.startswith("memory"))
 
 
 # --- Voice cloning: create persistent voice from upload ---
+_UPLOAD_CHUNK_BYTES = 64 * 1024
+# Leading bytes of the audio containers we accept: WAV, Ogg, FLAC, MP3 (ID3 tag), WebM/Matroska (browser recordings)
+_AUDIO_MAGIC = (b"RIFF", b"OggS", b"fLaC", b"ID3", b"\x1a\x45\xdf\xa3")
+
+
+def _looks_like_audio(head: bytes) -> bool:
+    """Cheap container sniff on the first bytes of an upload (also MP3 frame sync and MP4/M4A 'ftyp')."""
+    return (
+        head.startswith(_AUDIO_MAGIC)
+        or (len(head) > 1 and head[0] == 0xFF and head[1] & 0xE0 == 0xE0)
+        or head[4:8] == b"ftyp"
+    )
+
+
+async def _save_upload(upload: UploadFile, path: str) -> None:
+    """Copy an upload to path in 64 KiB chunks; 400 if it is not audio, 413 once it exceeds MAX_UPLOAD_BYTES (no file left behind)."""
+    total = 0
+    try:
+        with open(path, "wb") as f:
+            while chunk := await upload.read(_UPLOAD_CHUNK_BYTES):
+                if not total and not _looks_like_audio(chunk):
+                    raise HTTPException(400, "Unsupported audio format; upload WAV, MP3, FLAC, Ogg, WebM or M4A")
+                total += len(chunk)
+                if MAX_UPLOAD_BYTES and total > MAX_UPLOAD_BYTES:
+                    raise HTTPException(413, f"Upload exceeds {MAX_UPLOAD_BYTES} bytes")
+                await run_in_threadpool(f.write, chunk)
+    except BaseException:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        raise
+
+
 @app.post("/voices/clone")
 @limiter.limit(RATE_LIMIT_CLONE or "1000/minute")
 async def create_voice(
@@ -202,15 +466,13 @@ async def create_voice(
     if not audio.filename:
         raise HTTPException(400, "No file")
     suffix = os.path.splitext(audio.filename)[1] or ".wav"
-    body = await audio.read()
 
     if _use_clone_queue():
         os.makedirs(PENDING_CLONE_PATH, exist_ok=True)
         import uuid
         upload_id = str(uuid.uuid4())
         upload_path = os.path.join(PENDING_CLONE_PATH, f"{upload_id}{suffix}")
-        with open(upload_path, "wb") as f:
-            f.write(body)
+        await _save_upload(audio, upload_path)
         try:
             from celery_app import clone_voice_task
             owner_id = get_owner_id(request)
@@ -232,9 +494,9 @@ async def create_voice(
             increment("errors_total")
             raise HTTPException(503, f"Queue unavailable: {e!s}")
 
-    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-        tmp.write(body)
-        tmp_path = tmp.name
+    fd, tmp_path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    await _save_upload(audio, tmp_path)
     try:
         owner_id = get_owner_id(request)
         voice_id = clone_voice(
@@ -261,11 +523,24 @@ async def create_voice(
 
 
 # --- Job status (when clone or narrate is enqueued) ---
-@app.get("/jobs/{job_id}")
-def job_status(job_id: str):
-    """Return status and result for an async clone or narrate job. When completed, includes voice_id (clone) or result_url (narrate)."""
-    if not _use_clone_queue():
-        raise HTTPException(404, "Job not found")
+# Completed/failed job payloads never change; they are kept so repeat polls skip the broker
+_JOB_TERMINAL_STATUSES = frozenset(("completed", "failed"))
+_JOB_TERMINAL_CACHE_MAX = 10_000
+# Same cadence as the client's GET /jobs polling, so a stream never costs the result backend more than polling
+_JOB_EVENTS_INTERVAL_SEC = 2.0
+# Celery reports unknown or expired ids as PENDING forever, so streams are bounded; clients fall back to polling
+_JOB_EVENTS_MAX_PENDING = 30  # consecutive pending checks (about a minute)
+_JOB_EVENTS_MAX_SEC = 600.0
+_job_terminal_cache: dict[str, dict] = {}
+_job_terminal_lock = threading.Lock()
+
+
+def _job_status_payload(job_id: str) -> dict:
+    """Status dict for a Celery clone or narrate job (see GET /jobs/{job_id})."""
+    with _job_terminal_lock:
+        cached = _job_terminal_cache.get(job_id)
+    if cached is not None:
+        return cached
     from celery.result import AsyncResult
     from celery_app import app as celery_app
     result = AsyncResult(job_id, app=celery_app)
@@ -275,13 +550,56 @@ def job_status(job_id: str):
         res = result.result
         if isinstance(res, dict) and res.get("job_type") == "narrate":
             if res.get("status") == "failed":
-                return {"job_id": job_id, "status": "failed", "error": res.get("error", "Unknown error")}
-            return {"job_id": job_id, "status": "completed", "result_url": f"/jobs/{job_id}/result"}
-        voice_id = res.get("voice_id") if isinstance(res, dict) else res
-        return {"job_id": job_id, "status": "completed", "voice_id": voice_id}
-    if result.state == "FAILURE":
-        return {"job_id": job_id, "status": "failed", "error": str(result.result) if result.result else "Unknown error"}
-    return {"job_id": job_id, "status": result.state.lower(), "result": str(result.result)}
+                payload = {"job_id": job_id, "status": "failed", "error": res.get("error", "Unknown error")}
+            else:
+                payload = {"job_id": job_id, "status": "completed", "result_url": f"/jobs/{job_id}/result"}
+        else:
+            voice_id = res.get("voice_id") if isinstance(res, dict) else res
+            payload = {"job_id": job_id, "status": "completed", "voice_id": voice_id}
+    elif result.state == "FAILURE":
+        payload = {"job_id": job_id, "status": "failed", "error": str(result.result) if result.result else "Unknown error"}
+    else:
+        return {"job_id": job_id, "status": result.state.lower(), "result": str(result.result)}
+    with _job_terminal_lock:
+        if len(_job_terminal_cache) >= _JOB_TERMINAL_CACHE_MAX:
+            _job_terminal_cache.pop(next(iter(_job_terminal_cache)))
+        _job_terminal_cache[job_id] = payload
+    return payload
+
+
+@app.get("/jobs/{job_id}")
+def job_status(job_id: str):
+    """Return status and result for an async clone or narrate job. When completed, includes voice_id (clone) or result_url (narrate)."""
+    if not _use_clone_queue():
+        raise HTTPException(404, "Job not found")
+    # Polled in a loop by clients: plain JSON-native dicts go straight to JSONResponse, skipping jsonable_encoder
+    return JSONResponse(_job_status_payload(job_id))
+
+
+@app.get("/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """Server-sent events: the job's status (same JSON as GET /jobs/{job_id}) each time it changes; ends when the job finishes,
+    stays pending for about a minute (e.g. an unknown id) or after 10 minutes. Clients then fall back to polling."""
+    if not _use_clone_queue():
+        raise HTTPException(404, "Job not found")
+
+    async def events():
+        last = None
+        pending = 0
+        deadline = time.monotonic() + _JOB_EVENTS_MAX_SEC
+        while True:
+            payload = await run_in_threadpool(_job_status_payload, job_id)
+            if payload != last:
+                last = payload
+                yield f"data: {json.dumps(payload, separators=(',', ':'))}\n\n"
+            if payload["status"] in _JOB_TERMINAL_STATUSES:
+                return
+            pending = pending + 1 if payload["status"] == "pending" else 0
+            if pending >= _JOB_EVENTS_MAX_PENDING or time.monotonic() >= deadline:
+                return
+            await asyncio.sleep(_JOB_EVENTS_INTERVAL_SEC)
+
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
 
 
 @app.get("/jobs/{job_id}/result")
@@ -300,12 +618,21 @@ def job_result(job_id: str):
     wav_path = os.path.join(NARRATE_RESULT_PATH, f"{job_id}.wav")
     if not os.path.isfile(wav_path):
         raise HTTPException(404, "Result file not found")
+    if NARRATE_ACCEL_REDIRECT_PREFIX:
+        # nginx serves the file itself (sendfile); the body here is empty
+        return Response(
+            media_type="audio/wav",
+            headers={
+                "X-Accel-Redirect": f"{NARRATE_ACCEL_REDIRECT_PREFIX.rstrip('/')}/{job_id}.wav",
+                "Content-Disposition": 'attachment; filename="narration.wav"',
+            },
+        )
     return FileResponse(wav_path, media_type="audio/wav", filename="narration.wav")
 
 # --- List all voices (for UI dropdown and My voices panel) ---
 @app.get("/voices/list")
 def voices_list(request: Request, owner_id: Optional[str] = Depends(get_owner_id)):
-    return list_voices(owner_id=owner_id)
+    return JSONResponse(list_voices(owner_id=owner_id))
 
 # --- GDPR: get voice metadata / delete voice ---
 @app.get("/voices/{voice_id}")
@@ -313,12 +640,13 @@ def get_voice(voice_id: str, request: Request, owner_id: Optional[str] = Depends
     meta = get_metadata(voice_id, owner_id=owner_id)
     if not meta:
         raise HTTPException(404, "Voice not found")
-    return meta
+    return JSONResponse(meta)
 
 @app.delete("/voices/{voice_id}")
 def remove_voice(voice_id: str, request: Request, _auth: None = Depends(verify_api_key), owner_id: Optional[str] = Depends(get_owner_id)):
     """Delete voice embedding and metadata (GDPR right to erasure)."""
     if delete_voice(voice_id, owner_id=owner_id):
+        _invalidate_embedding_path(voice_id)
         return {"deleted": voice_id}
     raise HTTPException(404, "Voice not found")
 
@@ -330,6 +658,7 @@ def admin_remove_voice(voice_id: str, x_admin_key: str = Header(None, alias="X-A
     if not ADMIN_API_KEY or x_admin_key != ADMIN_API_KEY:
         raise HTTPException(403, "Forbidden")
     if delete_voice(voice_id):
+        _invalidate_embedding_path(voice_id)
         return {"deleted": voice_id}
     raise HTTPException(404, "Voice not found")
 
@@ -346,7 +675,66 @@ def patch_voice(voice_id: str, body: PatchVoiceBody, request: Request, _auth: No
     meta = get_metadata(voice_id, owner_id=owner_id)
     return meta if meta else {"voice_id": voice_id}
 
+@dataclass(slots=True)
+class _TTSInput:
+    """Validated input shared by /tts and /tts/narrate."""
+    text: str
+    language_tag: str
+    speaker_emb_path: Optional[str] = None
+
+
+def _resolve_voice(voice_id: str) -> str:
+    """Preset name or stored voice file path for voice_id; 404 if unknown."""
+    if _is_preset_voice(voice_id):
+        return voice_id.strip()
+    path = _cached_embedding_path(voice_id)
+    if not path:
+        raise HTTPException(404, "Voice not found")
+    return path
+
+
+def _prepare_tts_input(
+    text: Optional[str],
+    language_tag: Optional[str],
+    voice_id: Optional[str] = None,
+    max_chars: Optional[int] = None,
+) -> _TTSInput:
+    """Strip and check text, normalize the language tag and resolve voice_id (when given)."""
+    text = (text or "").strip()
+    if not text:
+        raise HTTPException(400, "No text")
+    if max_chars is not None and len(text) > max_chars:
+        raise HTTPException(400, f"Text exceeds {max_chars} characters")
+    return _TTSInput(
+        text=text,
+        language_tag=_normalize_lang_tag(language_tag),
+        speaker_emb_path=_resolve_voice(voice_id) if voice_id else None,
+    )
+
+
 # --- TTS: preset or custom voice ---
+
+def _wav_header(sample_rate: int, n_samples: Optional[int] = None) -> bytes:
+    """44-byte mono PCM16 WAV header. Without n_samples (streamed output) the RIFF/data sizes are 0xFFFFFFFF."""
+    data_size = 0xFFFFFFFF if n_samples is None else n_samples * 2
+    riff_size = 0xFFFFFFFF if n_samples is None else 36 + data_size
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", riff_size, b"WAVE", b"fmt ", 16, 1, 1, sample_rate, sample_rate * 2, 2, 16, b"data", data_size,
+    )
+
+
+def _wav_response(audio: np.ndarray, sample_rate: int) -> StreamingResponse:
+    """Send audio as a PCM16 WAV: the header, then the samples' bytes, with no intermediate WAV buffer."""
+    pcm = to_pcm16(audio).astype("<i2", copy=False)
+
+    async def body():
+        yield _wav_header(sample_rate, pcm.size)
+        yield pcm.tobytes()
+
+    return StreamingResponse(body(), media_type="audio/wav")
+
+
 @app.post("/tts")
 @limiter.limit(RATE_LIMIT_TTS or "1000/minute")
 async def tts_endpoint(
@@ -365,49 +753,27 @@ async def tts_endpoint(
     - voice_id (persistent cloned voice),
     - or reference_audio (one-off clone for this request).
     """
-    text = (text or "").strip()
-    if not text:
-        raise HTTPException(400, "No text")
     if voice_id:
         request.state.voice_id = voice_id
-
-    # Ensure we always pass a supported language tag to the engine
-    supported = _lang_tags()
-    lang_tag = (language_tag or "").strip() or "en"
-    if lang_tag not in supported and supported:
-        lang_tag = supported[0]
-    language_tag = lang_tag
-
-    speaker_emb_path: Optional[str] = None
-
-    # Option A: Use a saved voice or preset
-    if voice_id:
-        if _is_preset_voice(voice_id):
-            speaker_emb_path = voice_id.strip()
-        else:
-            speaker_emb_path = load_embedding_path(voice_id)
-        if not speaker_emb_path:
-            raise HTTPException(404, "Voice not found")
+    # Option A: voice_id (saved voice or preset) is resolved here; language tag is always a supported one
+    req = _prepare_tts_input(text, language_tag, voice_id)
 
     # Option B: One-off reference audio (Pocket loads voice from WAV path)
-    elif reference_audio and reference_audio.filename:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".wav") as tmp:
-            tmp.write(await reference_audio.read())
-            tmp_path = tmp.name
+    if not voice_id and reference_audio and reference_audio.filename:
+        fd, tmp_path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        await _save_upload(reference_audio, tmp_path)
         try:
-            audio, sr = tts_generate(
-                text,
-                language_tag=language_tag,
+            audio, sr = await _tts_generate_shared(
+                req.text,
+                language_tag=req.language_tag,
                 speaker_emb_path=tmp_path,
                 temperature=temperature,
                 top_p=top_p,
                 repetition_penalty=repetition_penalty,
             )
             increment("tts_requests_total")
-            buf = io.BytesIO()
-            sf.write(buf, audio, sr, format="WAV")
-            buf.seek(0)
-            return StreamingResponse(buf, media_type="audio/wav")
+            return _wav_response(audio, sr)
         except Exception:
             increment("errors_total")
             raise
@@ -418,10 +784,10 @@ async def tts_endpoint(
                 pass
 
     try:
-        audio, sr = tts_generate(
-            text,
-            language_tag=language_tag,
-            speaker_emb_path=speaker_emb_path,
+        audio, sr = await _tts_generate_shared(
+            req.text,
+            language_tag=req.language_tag,
+            speaker_emb_path=req.speaker_emb_path,
             temperature=temperature,
             top_p=top_p,
             repetition_penalty=repetition_penalty,
@@ -438,10 +804,39 @@ async def tts_endpoint(
         raise HTTPException(500, str(e))
 
     increment("tts_requests_total")
-    buf = io.BytesIO()
-    sf.write(buf, audio, sr, format="WAV")
-    buf.seek(0)
-    return StreamingResponse(buf, media_type="audio/wav")
+    return _wav_response(audio, sr)
+
+
+# Narrate chunks synthesized at once: one per TTS worker process (up to 4), else one ahead of the sender
+_NARRATE_CONCURRENCY = min(4, TTS_WORKERS) if TTS_WORKERS > 0 else 1
+
+
+async def _narrate_wav_stream(first: np.ndarray, sample_rate: int, rest: list[str], tts_kwargs: dict):
+    """Yield the WAV header and first chunk, then the remaining chunks in order while later ones are synthesized."""
+    pending: deque[asyncio.Future] = deque()
+    upcoming = iter(rest)
+
+    def fill() -> None:
+        while len(pending) < _NARRATE_CONCURRENCY and (chunk := next(upcoming, None)) is not None:
+            pending.append(asyncio.ensure_future(_tts_generate_shared(chunk, **tts_kwargs)))
+
+    fill()
+    try:
+        yield _wav_header(sample_rate)
+        yield to_pcm16(first).astype("<i2", copy=False).tobytes()
+        while pending:
+            try:
+                audio, _ = await pending.popleft()
+            except Exception:
+                # Headers are already sent; end the stream early rather than fail mid-body
+                increment("errors_total")
+                logging.exception("Narrate TTS failed mid-stream")
+                break
+            fill()
+            yield to_pcm16(audio).astype("<i2", copy=False).tobytes()
+    finally:
+        for fut in pending:
+            fut.cancel()
 
 
 class NarrateBody(BaseModel):
@@ -457,17 +852,13 @@ class NarrateBody(BaseModel):
 @limiter.limit("5/minute")
 async def tts_narrate(request: Request, body: NarrateBody, _auth: None = Depends(verify_api_key)):
     """
-    Long-form narration: split text into chunks, TTS each, concatenate, return one WAV.
+    Long-form narration: split text into chunks, TTS each, stream one WAV as chunks are synthesized.
     Limits: 5000 chars, 15 chunks (enforced in split_for_tts).
     When async=true and Celery is configured, enqueues and returns job_id; poll GET /jobs/{job_id} then GET /jobs/{job_id}/result for WAV.
     """
-    text = (body.text or "").strip()
-    if not text:
-        raise HTTPException(400, "No text")
-    if len(text) > MAX_TOTAL_CHARS:
-        raise HTTPException(400, f"Text exceeds {MAX_TOTAL_CHARS} characters")
+    req = _prepare_tts_input(body.text, body.language_tag, max_chars=MAX_TOTAL_CHARS)
     chunk_by = body.chunk_by if body.chunk_by in ("sentence", "paragraph", "fixed") else "sentence"
-    chunks = split_for_tts(text, chunk_by=chunk_by, max_chars=max(50, min(body.max_chars, 1500)))
+    chunks = split_for_tts(req.text, chunk_by=chunk_by, max_chars=max(50, min(body.max_chars, 1500)))
     if not chunks:
         raise HTTPException(400, "No chunks produced from text")
     if len(chunks) > MAX_CHUNKS:
@@ -481,14 +872,10 @@ async def tts_narrate(request: Request, body: NarrateBody, _auth: None = Depends
             increment("errors_total")
             raise HTTPException(400, "Narrate requires a voice_id.")
         job_id = str(uuid.uuid4())
-        supported = _lang_tags()
-        lang_tag = (body.language_tag or "").strip() or "en"
-        if lang_tag not in supported and supported:
-            lang_tag = supported[0]
         narrate_task.delay(
             job_id,
-            text=text,
-            language_tag=lang_tag,
+            text=req.text,
+            language_tag=req.language_tag,
             voice_id=body.voice_id,
             chunk_by=chunk_by,
             max_chars=max(50, min(body.max_chars, 1500)),
@@ -499,34 +886,18 @@ async def tts_narrate(request: Request, body: NarrateBody, _auth: None = Depends
     if not body.voice_id:
         increment("errors_total")
         raise HTTPException(400, "Narrate requires a voice_id. Select a character voice.")
-    if _is_preset_voice(body.voice_id):
-        speaker_emb_path = body.voice_id.strip()
-    else:
-        speaker_emb_path = load_embedding_path(body.voice_id)
-    if not speaker_emb_path:
-        raise HTTPException(404, "Voice not found")
-
-    supported = _lang_tags()
-    lang_tag = (body.language_tag or "").strip() or "en"
-    if lang_tag not in supported and supported:
-        lang_tag = supported[0]
-    language_tag = lang_tag
-
-    audio_list: list = []
-    sr_out: Optional[int] = None
+    req.speaker_emb_path = _resolve_voice(body.voice_id)
+
+    tts_kwargs = {
+        "language_tag": req.language_tag,
+        "speaker_emb_path": req.speaker_emb_path,
+        "temperature": 0.65,
+        "top_p": 0.80,
+        "repetition_penalty": 1.15,
+    }
+    # The first chunk is synthesized before responding so TTS errors still map to a status code
     try:
-        for chunk in chunks:
-            audio, sr = tts_generate(
-                chunk,
-                language_tag=language_tag,
-                speaker_emb_path=speaker_emb_path,
-                temperature=0.65,
-                top_p=0.80,
-                repetition_penalty=1.15,
-            )
-            if sr_out is None:
-                sr_out = sr
-            audio_list.append(audio)
+        first, sr_out = await _tts_generate_shared(chunks[0], **tts_kwargs)
     except ValueError as e:
         increment("errors_total")
         raise HTTPException(400, str(e))
@@ -538,14 +909,12 @@ async def tts_narrate(request: Request, body: NarrateBody, _auth: None = Depends
         logging.exception("Narrate TTS failed")
         raise HTTPException(500, str(e))
 
-    concatenated = np.concatenate(audio_list)
     increment("tts_requests_total")
-    buf = io.BytesIO()
-    sf.write(buf, concatenated, sr_out, format="WAV")
-    buf.seek(0)
-    response = StreamingResponse(buf, media_type="audio/wav")
-    response.headers["Content-Disposition"] = 'attachment; filename="narration.wav"'
-    return response
+    return StreamingResponse(
+        _narrate_wav_stream(first, sr_out, chunks[1:], tts_kwargs),
+        media_type="audio/wav",
+        headers={"Content-Disposition": 'attachment; filename="narration.wav"'},
+    )
 
 
 # --- AI: Co-GM NPC Dialogue Generation ---
@@ -602,7 +971,8 @@ async def ai_dialogue(
         raise HTTPException(500, str(e))
 
     increment("ai_dialogue_requests_total")
-    return DialogueResponse(dialogue=dialogue, voice_id=body.voice_id or None)
+    # Plain JSON response: response_model stays for OpenAPI, but FastAPI skips re-validating it
+    return JSONResponse({"dialogue": dialogue, "voice_id": body.voice_id or None})
 
 
 # --- AI: Adventure Import (parse read-alouds and NPCs from uploaded adventure) ---
@@ -676,32 +1046,68 @@ async def parse_adventure_endpoint(
         raise HTTPException(500, str(e))
 
     increment("ai_dialogue_requests_total")
-    return ParseAdventureResponse(
+    # Items are validated once here (Claude output); returning JSONResponse skips FastAPI's second pass
+    return JSONResponse(ParseAdventureResponse(
         read_alouds=[ReadAloud(**r) for r in result.get("read_alouds", [])],
         npcs=[ParsedNPC(**n) for n in result.get("npcs", [])],
         char_count=char_count,
-    )
+    ).model_dump())
 
 
-# --- Favicon (browsers request this automatically; 204 avoids 404 in logs) ---
+# --- Favicon (browsers request this automatically): a 1x1 transparent PNG they may cache for a day ---
+_FAVICON_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
 @app.get("/favicon.ico")
 def favicon():
-    return Response(status_code=204)
+    return Response(_FAVICON_PNG, media_type="image/png", headers={"Cache-Control": "public, max-age=86400"})
 
-# --- Web UI: served from static file ---
-_STATIC_INDEX = Path(__file__).resolve().parent / "static" / "index.html"
-_STATIC_TEST  = Path(__file__).resolve().parent / "static" / "test_ui.html"
+# --- Web UI: pages are read once at import and revalidated by ETag ---
+_STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+
+def _page_headers(body: bytes, cache_control: str = "public, max-age=300") -> dict[str, str]:
+    return {"Cache-Control": cache_control, "ETag": f'"{hashlib.md5(body).hexdigest()}"'}
+
+
+def _cached_response(request: Request, body: bytes, headers: dict[str, str], media_type: str) -> Response:
+    """304 when the client already has this body (If-None-Match), else the body with its cache headers."""
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+_INDEX_HTML = (_STATIC_DIR / "index.html").read_bytes()
+_INDEX_HEADERS = _page_headers(_INDEX_HTML)
+_TEST_HTML = (_STATIC_DIR / "test_ui.html").read_bytes()
+_TEST_HEADERS = _page_headers(_TEST_HTML)
+
+@app.get("/", response_class=HTMLResponse)
+def index(request: Request):
+    return _cached_response(request, _INDEX_HTML, _INDEX_HEADERS, "text/html")
 
 @app.get("/test", response_class=HTMLResponse)
-def test_ui():
-    return FileResponse(_STATIC_TEST, media_type="text/html")
+def test_ui(request: Request):
+    return _cached_response(request, _TEST_HTML, _TEST_HEADERS, "text/html")
+
+# Live board stylesheet: served with a content hash so browsers can cache it indefinitely
+_LIVE_CSS = (_STATIC_DIR / "live.css").read_bytes()
+_LIVE_CSS_HEADERS = _page_headers(_LIVE_CSS, "public, max-age=31536000, immutable")
+_LIVE_HTML = (_STATIC_DIR / "live.html").read_bytes().replace(
+    b"__LIVE_CSS_VERSION__", _LIVE_CSS_HEADERS["ETag"][1:13].encode()
+)
+_LIVE_HEADERS = _page_headers(_LIVE_HTML)
+
+@app.get("/static/live.css")
+def live_board_css(request: Request):
+    return _cached_response(request, _LIVE_CSS, _LIVE_CSS_HEADERS, "text/css")
 
 @app.get("/live", response_class=HTMLResponse)
-def live_board():
-    live_html = Path(__file__).resolve().parent / "static" / "live.html"
-    return FileResponse(live_html, media_type="text/html")
+def live_board(request: Request):
+    return _cached_response(request, _LIVE_HTML, _LIVE_HEADERS, "text/html")
 
-app.mount("/static", StaticFiles(directory=Path(__file__).resolve().parent / "static"), name="static_files")
+app.mount("/static", StaticFiles(directory=_STATIC_DIR), name="static_files")
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,11 @@
+"""Tests for Co-DM Live Board helpers (no model load)."""
+from live_board import _parse_voice_choice
+
+
+def test_parse_voice_choice():
+    """Dropdown labels map to preset names or cloned voice_ids."""
+    assert _parse_voice_choice("alba [preset]") == "alba"
+    assert _parse_voice_choice("Grimble [0b6c1f2e-aaaa]") == "0b6c1f2e-aaaa"
+    assert _parse_voice_choice("marius") == "marius"
+    assert _parse_voice_choice("") is None
+    assert _parse_voice_choice(None) is None
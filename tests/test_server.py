@@ -16,6 +16,32 @@ def test_health():
     assert data.get("service") == "kani-tts"
 
 
+def test_static_json_endpoints():
+    """GET /voices and /limits return the precomputed JSON bodies."""
+    r = client.get("/voices")
+    assert r.status_code == 200
+    assert r.headers.get("content-type", "").startswith("application/json")
+    data = r.json()
+    assert "en" in data.get("language_tags", [])
+    assert "alba" in data.get("preset_voices", [])
+    r = client.get("/limits")
+    assert r.status_code == 200
+    assert r.json().get("max_narrate_chunks", 0) > 0
+
+
+def test_live_board_css_cached():
+    """/live links the hashed stylesheet; a matching If-None-Match gets 304."""
+    page = client.get("/live")
+    assert page.status_code == 200
+    assert "/static/live.css?v=" in page.text and "__LIVE_CSS_VERSION__" not in page.text
+    r = client.get("/static/live.css")
+    assert r.status_code == 200
+    assert r.headers["content-type"].startswith("text/css")
+    assert "immutable" in r.headers["cache-control"]
+    r = client.get("/static/live.css", headers={"If-None-Match": r.headers["etag"]})
+    assert r.status_code == 304
+
+
 def test_ready_before_model_load():
     """GET /ready returns 503 until model has been loaded (or 200 if already loaded)."""
     r = client.get("/ready")
@@ -37,3 +63,21 @@ def test_tts_with_preset_voice():
     assert r.status_code == 200, r.text[:500]
     assert r.headers.get("content-type", "").startswith("audio/")
     assert len(r.content) > 1000  # non-trivial WAV
+
+
+def test_tts_input_validation():
+    """POST /tts and /tts/narrate reject empty text and unknown voices before loading the model."""
+    r = client.post("/tts", data={"text": "   ", "voice_id": "alba"})
+    assert r.status_code == 400
+    r = client.post("/tts", data={"text": "Hello.", "voice_id": "no-such-voice"})
+    assert r.status_code == 404
+    r = client.post("/tts/narrate", json={"text": "Hello there.", "voice_id": "no-such-voice"})
+    assert r.status_code == 404
+    r = client.post("/tts/narrate", json={"text": "Hello there."})
+    assert r.status_code == 400
+
+
+def test_clone_rejects_non_audio_upload():
+    """POST /voices/clone sniffs the upload's first bytes and rejects non-audio before cloning."""
+    r = client.post("/voices/clone", files={"audio": ("sample.wav", b"<html>not audio</html>", "audio/wav")})
+    assert r.status_code == 400
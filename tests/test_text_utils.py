@@ -0,0 +1,36 @@
+"""Tests for long-form text splitting (split_for_tts)."""
+from text_utils import MAX_CHUNKS, MAX_TOTAL_CHARS, split_for_tts
+
+
+def test_split_sentences_and_paragraphs():
+    """Sentences pack up to max_chars; paragraphs split on one or more blank lines."""
+    text = "First sentence here. Second one! Third? Fourth."
+    assert split_for_tts(text, max_chars=500) == [text]
+    assert split_for_tts(text, max_chars=25) == ["First sentence here.", "Second one! Third?", "Fourth."]
+    assert split_for_tts("One.\n\nTwo.\n\n\n\nThree.", chunk_by="paragraph") == ["One.", "Two.", "Three."]
+    assert split_for_tts("   ") == []
+
+
+def test_split_fixed_and_limits():
+    """Fixed mode breaks at word boundaries; output never exceeds MAX_CHUNKS."""
+    words = " ".join(["word"] * 40)
+    chunks = split_for_tts(words, chunk_by="fixed", max_chars=50)
+    assert all(len(c) <= 50 for c in chunks)
+    assert " ".join(chunks) == words
+    # max_chars is capped at 1500 in fixed mode, so a longer text still splits
+    assert len(split_for_tts(" ".join(["word"] * 400), chunk_by="fixed", max_chars=5000)) == 2
+    assert len(split_for_tts("Hi. " * 1000, max_chars=50)) == MAX_CHUNKS
+
+
+def test_split_keeps_abbreviations_and_ellipses():
+    """Titles like "Dr." and ellipses do not end a sentence chunk."""
+    text = "Dr. Smith waited... then left. Mr. Jones stayed."
+    assert split_for_tts(text, max_chars=35) == ["Dr. Smith waited... then left.", "Mr. Jones stayed."]
+
+
+def test_split_truncation_on_whitespace_leaves_no_empty_chunk():
+    """Cutting at MAX_TOTAL_CHARS right after a sentence end must not yield an empty or padded chunk."""
+    text = " ".join(["W" * 23 + "."] * 300)
+    assert text[MAX_TOTAL_CHARS - 1] == " "
+    chunks = split_for_tts(text, max_chars=499)
+    assert chunks and all(c and c == c.strip() for c in chunks)
@@ -8,6 +8,15 @@ from typing import List
 MAX_TOTAL_CHARS = 5000
 MAX_CHUNKS = 15
 
+# Titles and abbreviations whose trailing period does not end a sentence
+_ABBREVIATIONS = ("Dr", "Mr", "Mrs", "Ms", "Prof", "Sr", "Jr", "St", "vs", "etc", "e.g", "i.e")
+# Sentence end (. ! ?) followed by whitespace, except after an abbreviation or an ellipsis ("...");
+# paragraph break = blank line(s). Python lookbehinds are fixed-width, hence one per abbreviation.
+_SENT_RE = re.compile(
+    "".join(rf"(?<!\b{re.escape(a)}\.)" for a in _ABBREVIATIONS) + r"(?<!\.\.\.)(?<=[.!?])\s+"
+)
+_PARA_RE = re.compile(r"\n{2,}")
+
 
 def split_for_tts(
     text: str,
@@ -25,12 +34,18 @@ def split_for_tts(
         return []
 
     if len(text) > MAX_TOTAL_CHARS:
-        text = text[:MAX_TOTAL_CHARS]
+        # The cut can land on whitespace; re-strip so the sentence split below still sees trimmed text
+        text = text[:MAX_TOTAL_CHARS].rstrip()
+
+    limit = max(50, min(max_chars, 1500)) if chunk_by == "fixed" else max_chars
+    # Short input (the common live/chat case) is one chunk in every mode; skip the split machinery
+    if len(text) <= limit and "\n\n" not in text:
+        return [text]
 
     chunks: List[str] = []
 
     if chunk_by == "paragraph":
-        raw = [p.strip() for p in text.split("\n\n") if p.strip()]
+        raw = [p.strip() for p in _PARA_RE.split(text) if p.strip()]
         for p in raw:
             if len(chunks) >= MAX_CHUNKS:
                 break
@@ -38,37 +53,43 @@ def split_for_tts(
                 p = p[:MAX_TOTAL_CHARS]
             chunks.append(p)
     elif chunk_by == "fixed":
-        max_chars = max(50, min(max_chars, 1500))
-        remaining = text
-        while remaining and len(chunks) < MAX_CHUNKS:
-            if len(remaining) <= max_chars:
-                chunks.append(remaining.strip())
+        max_chars = limit
+        # Walk an index through text instead of re-slicing the remaining tail each chunk
+        n = len(text)
+        pos = 0
+        while pos < n and len(chunks) < MAX_CHUNKS:
+            if n - pos <= max_chars:
+                chunks.append(text[pos:].strip())
                 break
-            segment = remaining[:max_chars]
-            last_space = segment.rfind(" ")
-            if last_space > max_chars // 2:
+            last_space = text.rfind(" ", pos, pos + max_chars)
+            if last_space - pos > max_chars // 2:
                 cut = last_space + 1
             else:
-                cut = max_chars
-            chunks.append(remaining[:cut].strip())
-            remaining = remaining[cut:].strip()
+                cut = pos + max_chars
+            chunks.append(text[pos:cut].strip())
+            pos = cut
+            while pos < n and text[pos].isspace():
+                pos += 1
     else:
         # sentence: split on . ! ? followed by space or end
-        raw = re.split(r'(?<=[.!?])\s+', text)
-        current = ""
+        raw = _SENT_RE.split(text)
+        # Sentences of the chunk being built, joined only when it is emitted; cur_len = len(" ".join(parts))
+        parts: List[str] = []
+        cur_len = 0
+        # text is stripped and _SENT_RE consumes the whitespace between sentences, so pieces need no strip()
         for s in raw:
-            s = s.strip()
-            if not s:
-                continue
-            if len(current) + len(s) + 1 <= max_chars and len(chunks) < MAX_CHUNKS:
-                current = (current + " " + s).strip() if current else s
+            if cur_len + len(s) + 1 <= max_chars and len(chunks) < MAX_CHUNKS:
+                cur_len += len(s) + 1 if parts else len(s)
+                parts.append(s)
             else:
-                if current:
-                    chunks.append(current)
+                if parts:
+                    chunks.append(" ".join(parts))
                     if len(chunks) >= MAX_CHUNKS:
                         break
-                current = s[:max_chars] if len(s) > max_chars else s
-        if current and len(chunks) < MAX_CHUNKS:
-            chunks.append(current)
+                s = s[:max_chars]
+                parts = [s]
+                cur_len = len(s)
+        if parts and len(chunks) < MAX_CHUNKS:
+            chunks.append(" ".join(parts))
 
     return chunks[:MAX_CHUNKS]
@@ -2,23 +2,35 @@
 TTS service: thin interface over Pocket TTS (Kyutai).
 Callers get (audio_array, sample_rate). English-only; supports preset voices and cloned voices (.safetensors).
 """
+import functools
 import logging
 import os
 import tempfile
-from pathlib import Path
-from typing import Optional
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Final, Iterable, Iterator, Optional
 
 import numpy as np
 import soundfile as sf
 
-from config import AUDIO_CACHE_SIZE, HF_TOKEN
+from config import AUDIO_CACHE_SIZE, HF_TOKEN, TTS_INPROCESS_CONCURRENCY, VOICE_S3_CACHE_PATH, VOICE_STORAGE_PATH
 
 # Pocket TTS: English only; preset voice names from Kyutai
-DEFAULT_LANGUAGE_TAGS = ["en"]
-POCKET_PRESET_VOICES = ["alba", "marius", "javert", "jean", "fantine", "cosette", "eponine", "azelma"]
+DEFAULT_LANGUAGE_TAGS: Final = ("en",)
+POCKET_PRESET_VOICES: Final = ("alba", "marius", "javert", "jean", "fantine", "cosette", "eponine", "azelma")
+_POCKET_PRESET_SET: Final = frozenset(v.lower() for v in POCKET_PRESET_VOICES)
+# Stored voice files (local storage and voice_store's S3 download cache); only these are worth memoizing,
+# one-off reference clips would just push real voices out of the cache
+_STORED_VOICE_DIRS: Final = tuple(
+    os.path.abspath(d) for d in (VOICE_STORAGE_PATH, VOICE_S3_CACHE_PATH)
+)
 
 _model = None
-_audio_cache: list[str] = []
+_hf_patched = False
+# Bounded FIFO of generated WAV paths (oldest first, guarded by the lock); files are deleted on eviction
+_audio_cache: "OrderedDict[str, None]" = OrderedDict()
+_audio_cache_lock = threading.Lock()
 
 
 def _get_tts():
@@ -38,6 +50,10 @@ def _get_tts():
 
 def _inject_hf_token():
     """Make huggingface_hub use our token for every download (required for gated kyutai/pocket-tts)."""
+    global _hf_patched
+    # Patch once: a second call would wrap our own wrapper instead of the real hf_hub_download
+    if _hf_patched:
+        return
     import huggingface_hub.hub_mixin as hub_mixin
     from huggingface_hub import hf_hub_download as _real_hf_hub_download
 
@@ -58,6 +74,16 @@ def _inject_hf_token():
     # so we must patch the name they'll import (the module's binding)
     import huggingface_hub
     huggingface_hub.hf_hub_download = _hf_hub_download
+    _hf_patched = True
+
+
+def warm_up(loaded_counter=None) -> None:
+    """Load the model now instead of on the first request (e.g. as a worker process initializer).
+    loaded_counter: optional shared multiprocessing Value incremented once the model is loaded."""
+    _get_tts()
+    if loaded_counter is not None:
+        with loaded_counter.get_lock():
+            loaded_counter.value += 1
 
 
 def is_model_loaded() -> bool:
@@ -73,16 +99,88 @@ def get_preset_voices() -> list[str]:
 
 
 def _evict_old_audio():
-    while len(_audio_cache) >= AUDIO_CACHE_SIZE and _audio_cache:
-        path = _audio_cache.pop(0)
+    with _audio_cache_lock:
+        evicted = []
+        while len(_audio_cache) >= AUDIO_CACHE_SIZE and _audio_cache:
+            evicted.append(_audio_cache.popitem(last=False)[0])
+    for path in evicted:
         try:
             os.unlink(path)
         except OSError:
             pass
 
 
+def to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Convert float PCM in [-1, 1] to int16 (rounded and clipped); int16 input passes through."""
+    audio = np.asarray(audio)
+    if audio.dtype == np.int16:
+        return np.ascontiguousarray(audio)
+    return np.clip(np.rint(audio * 32767.0), -32768, 32767).astype(np.int16)
+
+
 def _is_preset_voice(voice_id: str) -> bool:
-    return voice_id and voice_id.strip().lower() in [v.lower() for v in POCKET_PRESET_VOICES]
+    return bool(voice_id) and voice_id.strip().lower() in _POCKET_PRESET_SET
+
+
+def _compute_voice_state(voice_ref: str):
+    import torch
+
+    with torch.inference_mode():
+        return _get_tts().get_state_for_audio_prompt(voice_ref)
+
+
+@functools.lru_cache(maxsize=32)
+def _voice_state_cached(voice_ref: str, mtime: float):
+    """Voice state for a preset or stored .safetensors path; mtime in the key invalidates re-cloned files."""
+    return _compute_voice_state(voice_ref)
+
+
+def _is_stored_voice_file(path: str) -> bool:
+    path = os.path.abspath(path)
+    return any(path.startswith(d + os.sep) for d in _STORED_VOICE_DIRS)
+
+
+def _resolve_voice_state(speaker_emb_path: Optional[str]):
+    """Validate a preset name or embedding path and return its Pocket voice state (cached for presets and stored voices)."""
+    if not speaker_emb_path or not speaker_emb_path.strip():
+        raise ValueError("Pocket TTS requires a voice to be selected (preset or cloned).")
+    voice_ref = speaker_emb_path.strip()
+    # Preset name or path to .safetensors (or any path Pocket accepts); one stat doubles as the exists check
+    preset = _is_preset_voice(voice_ref)
+    if preset:
+        mtime = 0.0
+    else:
+        try:
+            mtime = os.path.getmtime(voice_ref)
+        except OSError:
+            raise ValueError("Voice not found. Select a built-in voice or a cloned voice.") from None
+    try:
+        if preset or _is_stored_voice_file(voice_ref):
+            return _voice_state_cached(voice_ref, mtime)
+        return _compute_voice_state(voice_ref)
+    except Exception as e:
+        logging.exception("TTS voice state failed")
+        raise RuntimeError(f"Generation failed: {e!s}") from e
+
+
+def _as_numpy(audio) -> np.ndarray:
+    # Share the tensor's buffer instead of copying it (no-op .cpu() for CPU tensors)
+    if hasattr(audio, "detach"):
+        return audio.detach().cpu().numpy()
+    return np.asarray(audio, dtype=np.float32)
+
+
+def _stream_audio(model, voice_state, text: str) -> Iterator[np.ndarray]:
+    """Yield audio chunks from Pocket's streaming generator as they are produced."""
+    import torch
+
+    try:
+        with torch.inference_mode():
+            for chunk in model.generate_audio_stream(voice_state, text):
+                yield _as_numpy(chunk)
+    except Exception as e:
+        logging.exception("TTS generate failed")
+        raise RuntimeError(f"Generation failed: {e!s}") from e
 
 
 def generate(
@@ -92,27 +190,24 @@ def generate(
     temperature: float = 0.65,
     top_p: float = 0.80,
     repetition_penalty: float = 1.15,
+    voice_state=None,
 ) -> tuple[np.ndarray, int]:
-    """Generate speech. speaker_emb_path: path to .safetensors file or preset voice name (e.g. alba). language_tag ignored (English only)."""
+    """Generate speech. speaker_emb_path: path to .safetensors file or preset voice name (e.g. alba). language_tag ignored (English only).
+    voice_state: already-resolved state (from generate_many) to skip the per-call voice lookup."""
     text = (text or "").strip()
     if not text:
         raise ValueError("Text is required")
-    if not speaker_emb_path or not speaker_emb_path.strip():
-        raise ValueError("Pocket TTS requires a voice to be selected (preset or cloned).")
-
+    if voice_state is None:
+        voice_state = _resolve_voice_state(speaker_emb_path)
     model = _get_tts()
-    voice_ref = speaker_emb_path.strip()
-    # Preset name or path to .safetensors (or any path Pocket accepts)
-    if not _is_preset_voice(voice_ref) and not Path(voice_ref).exists():
-        raise ValueError("Voice not found. Select a built-in voice or a cloned voice.")
+    import torch
 
     try:
-        voice_state = model.get_state_for_audio_prompt(voice_ref)
-        audio = model.generate_audio(voice_state, text)
-        if hasattr(audio, "numpy"):
-            arr = audio.numpy()
-        else:
-            arr = np.array(audio.cpu())
+        # generate_audio copies the state, so a cached one is safe to reuse across chunks and threads
+        # inference_mode skips autograd bookkeeping (version counters, saved activations) on every op
+        with torch.inference_mode():
+            audio = model.generate_audio(voice_state, text)
+        arr = _as_numpy(audio)
         sr = model.sample_rate
     except Exception as e:
         logging.exception("TTS generate failed")
@@ -121,22 +216,77 @@ def generate(
     return arr, sr
 
 
+def generate_many(
+    texts: Iterable[str],
+    language_tag: Optional[str] = "en",
+    speaker_emb_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    **kwargs,
+) -> Iterator[tuple[np.ndarray, int]]:
+    """Generate several chunks, yielding (audio, sample_rate) in input order while the next chunk is already running.
+    max_workers: chunks synthesized at once on the shared model (default TTS_INPROCESS_CONCURRENCY, i.e. 1, so the
+    only overlap is the next chunk running while the caller handles the current one)."""
+    texts = list(texts)
+    if not texts:
+        return
+    max_workers = max(1, min(max_workers or TTS_INPROCESS_CONCURRENCY, len(texts)))
+    # Resolve the voice once for the whole batch instead of once per chunk
+    kwargs["voice_state"] = _resolve_voice_state(speaker_emb_path)
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        pending: deque = deque()
+        it = iter(texts)
+        try:
+            for text in it:
+                pending.append(ex.submit(generate, text, language_tag, speaker_emb_path, **kwargs))
+                if len(pending) >= max_workers:
+                    break
+            while pending:
+                result = pending.popleft().result()
+                nxt = next(it, None)
+                if nxt is not None:
+                    pending.append(ex.submit(generate, nxt, language_tag, speaker_emb_path, **kwargs))
+                yield result
+        finally:
+            for fut in pending:
+                fut.cancel()
+
+
 def generate_to_file(
     text: str,
     language_tag: Optional[str] = "en",
     speaker_emb_path: Optional[str] = None,
 ) -> str:
-    audio, sample_rate = generate(text, language_tag=language_tag, speaker_emb_path=speaker_emb_path)
+    """Generate speech into a cached temp WAV and return its path; chunks are written as the model streams them."""
+    text = (text or "").strip()
+    if not text:
+        raise ValueError("Text is required")
+    voice_state = _resolve_voice_state(speaker_emb_path)
+    model = _get_tts()
+    if hasattr(model, "generate_audio_stream"):
+        chunks: Iterable[np.ndarray] = _stream_audio(model, voice_state, text)
+        sample_rate = model.sample_rate
+    else:
+        audio, sample_rate = generate(text, language_tag, speaker_emb_path, voice_state=voice_state)
+        chunks = (audio,)
     _evict_old_audio()
     fd, path = tempfile.mkstemp(suffix=".wav")
-    os.close(fd)
     try:
-        sf.write(path, audio, sample_rate)
-    except Exception as e:
+        # Write through mkstemp's descriptor rather than closing it and reopening the path
+        with os.fdopen(fd, "wb") as fh:
+            try:
+                f = sf.SoundFile(fh, "w", samplerate=sample_rate, channels=1, format="WAV", subtype="PCM_16")
+            except Exception as e:
+                raise RuntimeError(f"Could not save audio: {e!s}") from e
+            with f:
+                for chunk in chunks:
+                    # Quantize here so libsndfile writes int16 as-is; only one chunk is held in memory at a time
+                    f.buffer_write(to_pcm16(chunk), dtype="int16")
+    except BaseException:
         try:
             os.unlink(path)
         except OSError:
             pass
-        raise RuntimeError(f"Could not save audio: {e!s}") from e
-    _audio_cache.append(path)
+        raise
+    with _audio_cache_lock:
+        _audio_cache[path] = None
     return path
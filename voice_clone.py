@@ -7,12 +7,21 @@ import tempfile
 from pathlib import Path
 from typing import Optional
 
+import soundfile as sf
+
 from config import CLONE_MAX_DURATION_SEC, CLONE_MIN_DURATION_SEC
 from voice_store import create_voice_id, save_voice_from_file
 from tts_service import _get_tts
 
 
 def _get_duration_sec(audio_path: str) -> float:
+    # Header-only read for WAV/FLAC/OGG; decode with torchaudio only for formats libsndfile can't open (e.g. m4a)
+    try:
+        info = sf.info(audio_path)
+        if info.samplerate > 0 and info.frames > 0:
+            return info.frames / float(info.samplerate)
+    except Exception:
+        pass
     try:
         import torchaudio
         wav, sr = torchaudio.load(audio_path)
@@ -41,7 +50,10 @@ def clone_voice(
     tmp_path = None
     try:
         model = _get_tts()
-        voice_state = model.get_state_for_audio_prompt(audio_path)
+        import torch
+
+        with torch.inference_mode():
+            voice_state = model.get_state_for_audio_prompt(audio_path)
         from pocket_tts import export_model_state
         fd, tmp_path = tempfile.mkstemp(suffix=".safetensors")
         os.close(fd)
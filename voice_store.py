@@ -2,21 +2,34 @@
 Voice store: persist voice files (.safetensors for Pocket TTS) and metadata for voice_id.
 Supports local directory (default) or optional S3 backend via VOICE_STORAGE_BACKEND=s3.
 """
+import contextlib
+import io
 import json
 import logging
 import os
+import re
+import shutil
 import tempfile
+import threading
 import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 import torch
 
+try:
+    import fcntl
+except ImportError:  # Windows: in-process lock only
+    fcntl = None
+
 from config import (
     AWS_REGION,
     VOICE_STORAGE_BACKEND,
     VOICE_STORAGE_BUCKET,
+    VOICE_S3_CACHE_PATH,
     VOICE_STORAGE_PATH,
 )
 
@@ -35,18 +48,148 @@ if VOICE_STORAGE_BACKEND == "local":
 # --- Local backend ---
 
 VOICE_DATA_EXT = ".safetensors"
+# Storage root is fixed at import (from config), so build the base Path once
+_BASE = Path(VOICE_STORAGE_PATH)
 
 
 def _voice_data_path(voice_id: str) -> Path:
-    return Path(VOICE_STORAGE_PATH) / f"{voice_id}{VOICE_DATA_EXT}"
+    return _BASE / f"{voice_id}{VOICE_DATA_EXT}"
 
 
 def _pt_path(voice_id: str) -> Path:
-    return Path(VOICE_STORAGE_PATH) / f"{voice_id}.pt"
+    return _BASE / f"{voice_id}.pt"
 
 
 def _meta_path(voice_id: str) -> Path:
-    return Path(VOICE_STORAGE_PATH) / f"{voice_id}.json"
+    return _BASE / f"{voice_id}.json"
+
+
+# Append-only log of index changes: one {"op": "put"|"del", "voice_id", "meta"} JSON object per line.
+# Each save/update/delete appends one line; listing replays the log; compaction folds it back to one line per voice.
+LOCAL_INDEX_NAME = "index.ndjson"
+_INDEX_COMPACT_FACTOR = 10
+_INDEX_COMPACT_MIN_LINES = 100
+_INDEX_PATH = _BASE / LOCAL_INDEX_NAME
+_INDEX_LOCK_PATH = _BASE / ".index.lock"
+_local_index_lock = threading.Lock()
+
+
+def _local_index_path() -> Path:
+    return _INDEX_PATH
+
+
+def _index_entry(data: dict, voice_id: str) -> dict:
+    return {
+        "voice_id": data.get("voice_id", voice_id),
+        "name": data.get("name", ""),
+        "created_at": data.get("created_at", 0),
+        "consent_scope": data.get("consent_scope", "tts"),
+        "faction": data.get("faction", ""),
+    }
+
+
+def _local_scan_voices() -> list[dict]:
+    """Build the list from every per-voice metadata file (index rebuild)."""
+    try:
+        # scandir yields names without a stat per entry (unlike Path.glob)
+        with os.scandir(_BASE) as it:
+            paths = [e.path for e in it if e.name.endswith(".json") and e.is_file()]
+    except FileNotFoundError:
+        return []
+    # Reads are I/O-bound and release the GIL, so fan them out
+    with ThreadPoolExecutor(max_workers=min(16, len(paths) or 1)) as ex:
+        out = [e for e in ex.map(_read_index_entry, paths) if e is not None]
+    out.sort(key=lambda x: x["created_at"], reverse=True)
+    return out
+
+
+def _read_index_entry(path: str) -> Optional[dict]:
+    try:
+        with open(path, "rb") as f:
+            data = json.loads(f.read())
+    except (json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    return _index_entry(data, os.path.basename(path)[: -len(".json")])
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """Write to a temp file in the same directory and rename it over path (readers never see a partial file)."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _index_line(op: str, voice_id: str, meta: Optional[dict] = None) -> bytes:
+    rec = {"op": op, "voice_id": voice_id}
+    if meta is not None:
+        rec["meta"] = meta
+    return json.dumps(rec, separators=(",", ":")).encode() + b"\n"
+
+
+def _write_index_snapshot(entries: list[dict]) -> None:
+    _write_bytes_atomic(_local_index_path(), b"".join(_index_line("put", e["voice_id"], e) for e in entries))
+
+
+def _replay_index(raw: bytes) -> tuple[list[dict], int]:
+    """Fold log lines into the current voice list (newest first); returns (voices, line_count)."""
+    by_id: dict[str, dict] = {}
+    lines = 0
+    for line in raw.splitlines():
+        if not line:
+            continue
+        lines += 1
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError:
+            continue  # torn final line from a crashed writer
+        if rec.get("op") == "put":
+            by_id[rec["voice_id"]] = rec["meta"]
+        else:
+            by_id.pop(rec.get("voice_id"), None)
+    voices = sorted(by_id.values(), key=lambda x: x["created_at"], reverse=True)
+    return voices, lines
+
+
+def _local_index_apply(voice_id: str, meta: Optional[dict]) -> None:
+    """Record an upsert (meta given) or removal (meta None) of one voice in the local index."""
+    with _local_index_lock, _index_file_lock():
+        path = _local_index_path()
+        if not path.exists():
+            # No log yet: the per-voice files already reflect this change, so snapshot them
+            _write_index_snapshot(_local_scan_voices())
+            return
+        line = _index_line("put", voice_id, _index_entry(meta, voice_id)) if meta is not None else _index_line("del", voice_id)
+        with open(path, "a+b") as f:
+            # Terminate a torn last line (crashed writer) so it doesn't swallow this record
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+            f.write(line)
+
+
+@contextlib.contextmanager
+def _index_file_lock():
+    """Cross-process lock for index read-modify-write (server and Celery workers share the directory)."""
+    if fcntl is None:
+        yield
+        return
+    with open(_INDEX_LOCK_PATH, "a") as lf:
+        fcntl.flock(lf, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
 
 
 def _local_save_embedding(
@@ -65,13 +208,15 @@ def _local_save_embedding(
         if emb.ndim == 1:
             emb = emb.unsqueeze(0)
     torch.save(emb, pt)
-    meta.write_text(json.dumps({
+    data = {
         "voice_id": voice_id,
         "consent_scope": consent_scope,
         "created_at": time.time(),
         "name": (name or "").strip(),
         "faction": (faction or "").strip() or "",
-    }, indent=2))
+    }
+    _write_bytes_atomic(meta, json.dumps(data, indent=2).encode())
+    _local_index_apply(voice_id, data)
 
 
 def _local_load_embedding_path(voice_id: str) -> Optional[str]:
@@ -82,41 +227,44 @@ def _local_load_embedding_path(voice_id: str) -> Optional[str]:
 
 
 def _local_get_metadata(voice_id: str) -> Optional[dict]:
-    m = _meta_path(voice_id)
-    if m.exists():
-        return json.loads(m.read_text())
-    return None
+    try:
+        return json.loads(_meta_path(voice_id).read_bytes())
+    except FileNotFoundError:
+        return None
 
 
 def _local_list_voices() -> list[dict]:
-    out = []
-    base = Path(VOICE_STORAGE_PATH)
-    if not base.exists():
-        return out
-    for p in base.glob("*.json"):
-        try:
-            data = json.loads(p.read_text())
-            out.append({
-                "voice_id": data.get("voice_id", p.stem),
-                "name": data.get("name", ""),
-                "created_at": data.get("created_at", 0),
-                "consent_scope": data.get("consent_scope", "tts"),
-                "faction": data.get("faction", ""),
-            })
-        except (json.JSONDecodeError, OSError):
-            continue
-    out.sort(key=lambda x: x["created_at"], reverse=True)
-    return out
+    try:
+        voices, lines = _replay_index(_local_index_path().read_bytes())
+    except FileNotFoundError:
+        if not _BASE.exists():
+            return []
+        # First use: scan once and persist so later listings are a single read
+        with _local_index_lock, _index_file_lock():
+            if not _local_index_path().exists():
+                voices = _local_scan_voices()
+                _write_index_snapshot(voices)
+                return voices
+        voices, lines = _replay_index(_local_index_path().read_bytes())
+    if lines > _INDEX_COMPACT_MIN_LINES and lines > _INDEX_COMPACT_FACTOR * len(voices):
+        # Re-read under the lock so appends made since the read above are not dropped
+        with _local_index_lock, _index_file_lock():
+            voices, _ = _replay_index(_local_index_path().read_bytes())
+            _write_index_snapshot(voices)
+    return voices
 
 
 def _local_update_metadata(voice_id: str, name: Optional[str] = None) -> bool:
     m = _meta_path(voice_id)
-    if not m.exists():
+    try:
+        data = json.loads(m.read_bytes())
+    except FileNotFoundError:
         return False
-    data = json.loads(m.read_text())
     if name is not None:
         data["name"] = (name or "").strip()
-    m.write_text(json.dumps(data, indent=2))
+    # Replace rather than rewrite in place so concurrent readers never see a truncated file
+    _write_bytes_atomic(m, json.dumps(data, indent=2).encode())
+    _local_index_apply(voice_id, data)
     return True
 
 
@@ -128,18 +276,19 @@ def _local_save_voice_from_file(
     faction: Optional[str] = None,
 ) -> None:
     """Copy voice file to storage and write metadata. Used by Pocket TTS (.safetensors)."""
-    import shutil
     dest = _voice_data_path(voice_id)
     dest.parent.mkdir(parents=True, exist_ok=True)
     shutil.copy2(voice_file_path, dest)
     meta = _meta_path(voice_id)
-    meta.write_text(json.dumps({
+    data = {
         "voice_id": voice_id,
         "consent_scope": consent_scope,
         "created_at": time.time(),
         "name": (name or "").strip(),
         "faction": (faction or "").strip() or "",
-    }, indent=2))
+    }
+    _write_bytes_atomic(meta, json.dumps(data, indent=2).encode())
+    _local_index_apply(voice_id, data)
 
 
 def _local_delete_voice(voice_id: str) -> bool:
@@ -158,17 +307,172 @@ def _local_delete_voice(voice_id: str) -> bool:
             ok = True
         except OSError as e:
             logging.warning("Could not delete %s: %s", meta, e)
+    if ok:
+        _local_index_apply(voice_id, None)
     return ok
 
 
 # --- S3 backend ---
 
 INDEX_KEY = "index.json"
+# index.json grows with every voice and is read on each list, so it is stored compact (per-voice JSON stays indented)
+
+
+_s3_client_obj = None
+_s3_transfer_config_obj = None
+_S3_MULTIPART_BYTES = 4 * 1024 * 1024
+_s3_client_lock = threading.Lock()
 
 
 def _s3_client():
-    import boto3
-    return boto3.client("s3", region_name=AWS_REGION)
+    """Process-wide S3 client (thread-safe) so calls share one connection pool instead of new TLS sessions."""
+    global _s3_client_obj
+    if _s3_client_obj is None:
+        with _s3_client_lock:
+            if _s3_client_obj is None:
+                import boto3
+                from botocore.config import Config
+                _s3_client_obj = boto3.client(
+                    "s3",
+                    region_name=AWS_REGION,
+                    config=Config(max_pool_connections=50, retries={"mode": "standard"}),
+                )
+    return _s3_client_obj
+
+
+def _s3_transfer_config():
+    """Multipart/parallel settings for boto3's managed transfers (upload_file*/download_file*)."""
+    global _s3_transfer_config_obj
+    if _s3_transfer_config_obj is None:
+        from boto3.s3.transfer import TransferConfig
+        _s3_transfer_config_obj = TransferConfig(
+            multipart_threshold=_S3_MULTIPART_BYTES,
+            multipart_chunksize=_S3_MULTIPART_BYTES,
+            max_concurrency=4,
+            use_threads=True,
+        )
+    return _s3_transfer_config_obj
+
+
+# Downloaded voice files, reused across loads (shared by all processes on the host)
+_S3_FILE_CACHE_DIR = Path(VOICE_S3_CACHE_PATH)
+# Cache file names come from voice_id, so only plain ids (uuid4 from create_voice_id) may touch the disk
+_VOICE_ID_RE = re.compile(r"[A-Za-z0-9_-]+")
+_S3_FILE_CACHE_MAX = 256
+# A cached file is reused without asking S3 for this long after it was last checked; past that a HEAD
+# compares the ETag, so voices deleted or replaced on another host stop being served here
+_S3_FILE_CACHE_TTL_SEC = 30.0
+# voice_id -> (ETag of the cached copy, time.monotonic() of the last check); empty after a restart,
+# which makes every cached file stale until revalidated
+_s3_cache_checked: dict[str, tuple[Optional[str], float]] = {}
+_s3_cache_checked_lock = threading.Lock()
+
+# Shared pool for overlapping independent S3 round trips (botocore clients are thread-safe)
+_s3_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="voice-s3")
+
+
+def _s3_read_index(client, bucket: str) -> list[dict]:
+    try:
+        resp = client.get_object(Bucket=bucket, Key=INDEX_KEY)
+        return json.loads(resp["Body"].read())
+    except client.exceptions.NoSuchKey:
+        return []
+
+
+# Index writes are group-committed: concurrent saves/updates/deletes queue ops and one caller applies
+# them all with a single GET + conditional PUT. If-Match/If-None-Match turns a concurrent writer in
+# another process into a retry instead of a lost update.
+_INDEX_PUT_RETRIES = 5
+_index_ops: list[tuple[str, str, Optional[dict], Future]] = []
+_index_ops_lock = threading.Lock()
+_index_flushing = False
+
+
+def _s3_write_index_ops(ops: list[tuple[str, str, Optional[dict], Future]]) -> None:
+    client = _s3_client()
+    bucket = VOICE_STORAGE_BUCKET
+    for _ in range(_INDEX_PUT_RETRIES):
+        try:
+            resp = client.get_object(Bucket=bucket, Key=INDEX_KEY)
+            etag = resp["ETag"]
+            index = json.loads(resp["Body"].read())
+        except client.exceptions.NoSuchKey:
+            if all(op == "del" for op, _, _, _ in ops):
+                return  # nothing to remove from a missing index
+            etag, index = None, []
+        by_id = {e["voice_id"]: e for e in index}
+        for op, voice_id, meta, _ in ops:
+            if op == "put" or (op == "replace" and voice_id in by_id):
+                by_id[voice_id] = meta
+            elif op == "del":
+                by_id.pop(voice_id, None)
+        index = sorted(by_id.values(), key=lambda x: x["created_at"], reverse=True)
+        condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+        try:
+            client.put_object(
+                Bucket=bucket,
+                Key=INDEX_KEY,
+                Body=json.dumps(index, separators=(",", ":")),
+                ContentType="application/json",
+                **condition,
+            )
+            return
+        except client.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("PreconditionFailed", "ConditionalRequestConflict"):
+                raise
+    raise RuntimeError(f"Could not update S3 {INDEX_KEY}: concurrent writers kept changing it")
+
+
+def _s3_index_apply(op: str, voice_id: str, meta: Optional[dict] = None) -> None:
+    """Apply one index op ("put", "replace" if present, or "del"); returns once it is written."""
+    global _index_flushing
+    done: Future = Future()
+    with _index_ops_lock:
+        _index_ops.append((op, voice_id, meta, done))
+        leader = not _index_flushing
+        _index_flushing = True
+    if leader:
+        while True:
+            with _index_ops_lock:
+                batch = _index_ops[:]
+                _index_ops.clear()
+                if not batch:
+                    _index_flushing = False
+                    break
+            try:
+                _s3_write_index_ops(batch)
+            except Exception as e:
+                for *_, fut in batch:
+                    fut.set_exception(e)
+            else:
+                for *_, fut in batch:
+                    fut.set_result(None)
+    done.result()
+
+
+def _s3_store_voice(voice_id: str, upload_data: Callable[[], object], meta: dict) -> None:
+    """Upload voice data and its metadata concurrently, then add the voice to the index."""
+    client = _s3_client()
+    bucket = VOICE_STORAGE_BUCKET
+    f_data = _s3_pool.submit(upload_data)
+    f_meta = _s3_pool.submit(
+        client.put_object,
+        Bucket=bucket,
+        Key=f"{voice_id}.json",
+        Body=json.dumps(meta, indent=2),
+        ContentType="application/json",
+    )
+    wait((f_data, f_meta))
+    if f_data.exception() is not None:
+        # Don't leave metadata for a voice whose data never landed
+        if f_meta.exception() is None:
+            try:
+                client.delete_object(Bucket=bucket, Key=f"{voice_id}.json")
+            except Exception as e:
+                logging.warning("Could not delete s3 %s.json: %s", voice_id, e)
+        raise f_data.exception()
+    f_meta.result()
+    _s3_index_apply("put", voice_id, meta)
 
 
 def _s3_save_embedding(
@@ -178,8 +482,6 @@ def _s3_save_embedding(
     name: Optional[str] = None,
     faction: Optional[str] = None,
 ) -> None:
-    client = _s3_client()
-    bucket = VOICE_STORAGE_BUCKET
     if isinstance(embedding, dict):
         emb = {k: v.cpu() if hasattr(v, "cpu") else v for k, v in embedding.items()}
     else:
@@ -193,38 +495,11 @@ def _s3_save_embedding(
         "name": (name or "").strip(),
         "faction": (faction or "").strip() or "",
     }
-    with tempfile.NamedTemporaryFile(suffix=".pt", delete=False) as f:
-        torch.save(emb, f.name)
-        try:
-            with open(f.name, "rb") as g:
-                client.put_object(Bucket=bucket, Key=f"{voice_id}.pt", Body=g.read())
-        finally:
-            try:
-                os.unlink(f.name)
-            except OSError:
-                pass
-    client.put_object(
-        Bucket=bucket,
-        Key=f"{voice_id}.json",
-        Body=json.dumps(meta, indent=2),
-        ContentType="application/json",
-    )
-    # Update index
-    try:
-        resp = client.get_object(Bucket=bucket, Key=INDEX_KEY)
-        index = json.loads(resp["Body"].read().decode())
-    except client.exceptions.NoSuchKey:
-        index = []
-    index_by_id = {e["voice_id"]: e for e in index}
-    index_by_id[voice_id] = meta
-    index = list(index_by_id.values())
-    index.sort(key=lambda x: x["created_at"], reverse=True)
-    client.put_object(
-        Bucket=bucket,
-        Key=INDEX_KEY,
-        Body=json.dumps(index, indent=2),
-        ContentType="application/json",
-    )
+    # Serialize in memory and upload from the buffer (no temp file write + read back)
+    buf = io.BytesIO()
+    torch.save(emb, buf)
+    buf.seek(0)
+    _s3_store_voice(voice_id, lambda: _s3_client().upload_fileobj(buf, VOICE_STORAGE_BUCKET, f"{voice_id}.pt", Config=_s3_transfer_config()), meta)
 
 
 def _s3_save_voice_from_file(
@@ -235,11 +510,12 @@ def _s3_save_voice_from_file(
     faction: Optional[str] = None,
 ) -> None:
     """Upload voice file to S3 and write metadata. Used by Pocket TTS (.safetensors)."""
-    client = _s3_client()
-    bucket = VOICE_STORAGE_BUCKET
     key = f"{voice_id}{VOICE_DATA_EXT}"
-    with open(voice_file_path, "rb") as f:
-        client.put_object(Bucket=bucket, Key=key, Body=f.read())
+
+    def upload():
+        # Managed transfer streams from disk (multipart above the threshold) instead of f.read() into memory
+        _s3_client().upload_file(voice_file_path, VOICE_STORAGE_BUCKET, key, Config=_s3_transfer_config())
+
     meta = {
         "voice_id": voice_id,
         "consent_scope": consent_scope,
@@ -247,43 +523,109 @@ def _s3_save_voice_from_file(
         "name": (name or "").strip(),
         "faction": (faction or "").strip() or "",
     }
-    client.put_object(
-        Bucket=bucket,
-        Key=f"{voice_id}.json",
-        Body=json.dumps(meta, indent=2),
-        ContentType="application/json",
-    )
+    _s3_store_voice(voice_id, upload, meta)
+
+
+def _is_safe_voice_id(voice_id: str) -> bool:
+    return bool(voice_id) and _VOICE_ID_RE.fullmatch(voice_id) is not None
+
+
+def _s3_cached_voice_path(voice_id: str) -> Path:
+    return _S3_FILE_CACHE_DIR / f"{voice_id}{VOICE_DATA_EXT}"
+
+
+def _s3_evict_cached_files() -> None:
+    """Trim the download cache to _S3_FILE_CACHE_MAX files, least recently used (oldest atime) first."""
     try:
-        resp = client.get_object(Bucket=bucket, Key=INDEX_KEY)
-        index = json.loads(resp["Body"].read().decode())
-    except client.exceptions.NoSuchKey:
-        index = []
-    index_by_id = {e["voice_id"]: e for e in index}
-    index_by_id[voice_id] = meta
-    index = list(index_by_id.values())
-    index.sort(key=lambda x: x["created_at"], reverse=True)
-    client.put_object(
-        Bucket=bucket,
-        Key=INDEX_KEY,
-        Body=json.dumps(index, indent=2),
-        ContentType="application/json",
-    )
+        entries = [e for e in os.scandir(_S3_FILE_CACHE_DIR) if e.name.endswith(VOICE_DATA_EXT) and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return
+    if len(entries) <= _S3_FILE_CACHE_MAX:
+        return
+    entries.sort(key=lambda e: e.stat().st_atime)
+    for e in entries[: len(entries) - _S3_FILE_CACHE_MAX]:
+        try:
+            os.unlink(e.path)
+        except OSError:
+            pass
+
+
+def _s3_forget_cached_file(voice_id: str) -> None:
+    if not _is_safe_voice_id(voice_id):
+        return
+    with _s3_cache_checked_lock:
+        _s3_cache_checked.pop(voice_id, None)
+    try:
+        _s3_cached_voice_path(voice_id).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _s3_is_not_found(client, e: BaseException) -> bool:
+    return isinstance(e, client.exceptions.ClientError) and e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey")
 
 
 def _s3_load_embedding_path(voice_id: str) -> Optional[str]:
-    client = _s3_client()
-    bucket = VOICE_STORAGE_BUCKET
+    if not _is_safe_voice_id(voice_id):
+        return None
+    cached = _s3_cached_voice_path(voice_id)
+    client = None
+    etag = None
+    try:
+        st = cached.stat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        with _s3_cache_checked_lock:
+            known_etag, checked_at = _s3_cache_checked.get(voice_id, (None, float("-inf")))
+        if time.monotonic() - checked_at >= _S3_FILE_CACHE_TTL_SEC:
+            client = _s3_client()
+            try:
+                head = client.head_object(Bucket=VOICE_STORAGE_BUCKET, Key=f"{voice_id}{VOICE_DATA_EXT}")
+            except Exception as e:
+                if _s3_is_not_found(client, e):
+                    # Deleted elsewhere: drop our copy so it is not served again
+                    _s3_forget_cached_file(voice_id)
+                    return None
+                raise
+            etag = head.get("ETag")
+            # Without a recorded ETag (first check after download or restart) the size has to match instead
+            same = etag == known_etag if known_etag is not None else head.get("ContentLength") == st.st_size
+            if not same:
+                st = None  # replaced: download again below
+            else:
+                with _s3_cache_checked_lock:
+                    _s3_cache_checked[voice_id] = (etag, time.monotonic())
+        if st is not None:
+            # Hit: bump only atime for LRU eviction; mtime stays put because tts_service keys its voice-state cache on it
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(cached, (time.time(), st.st_mtime))
+                return str(cached)
+    if client is None:
+        client = _s3_client()
     key = f"{voice_id}{VOICE_DATA_EXT}"
+    _S3_FILE_CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=_S3_FILE_CACHE_DIR, prefix=".", suffix=".tmp")
     try:
-        resp = client.get_object(Bucket=bucket, Key=key)
-        data = resp["Body"].read()
-    except client.exceptions.NoSuchKey:
-        return None
-    fd, path = tempfile.mkstemp(suffix=VOICE_DATA_EXT)
-    os.close(fd)
-    with open(path, "wb") as f:
-        f.write(data)
-    return path
+        # Managed transfer writes straight into the file (ranged parallel GETs for large objects)
+        with os.fdopen(fd, "wb") as f:
+            client.download_fileobj(VOICE_STORAGE_BUCKET, key, f, Config=_s3_transfer_config())
+        # Publish complete files only; concurrent loaders of the same voice just replace each other's copy
+        os.replace(tmp, cached)
+    except BaseException as e:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        if _s3_is_not_found(client, e):
+            _s3_forget_cached_file(voice_id)
+            return None
+        raise
+    # ETag from the HEAD above when there was one; otherwise the first check after the TTL records it
+    with _s3_cache_checked_lock:
+        _s3_cache_checked[voice_id] = (etag, time.monotonic())
+    _s3_evict_cached_files()
+    return str(cached)
 
 
 def _s3_get_metadata(voice_id: str) -> Optional[dict]:
@@ -291,20 +633,13 @@ def _s3_get_metadata(voice_id: str) -> Optional[dict]:
     bucket = VOICE_STORAGE_BUCKET
     try:
         resp = client.get_object(Bucket=bucket, Key=f"{voice_id}.json")
-        return json.loads(resp["Body"].read().decode())
+        return json.loads(resp["Body"].read())
     except client.exceptions.NoSuchKey:
         return None
 
 
 def _s3_list_voices() -> list[dict]:
-    client = _s3_client()
-    bucket = VOICE_STORAGE_BUCKET
-    try:
-        resp = client.get_object(Bucket=bucket, Key=INDEX_KEY)
-        index = json.loads(resp["Body"].read().decode())
-        return index
-    except client.exceptions.NoSuchKey:
-        return []
+    return _s3_read_index(_s3_client(), VOICE_STORAGE_BUCKET)
 
 
 def _s3_update_metadata(voice_id: str, name: Optional[str] = None) -> bool:
@@ -321,50 +656,87 @@ def _s3_update_metadata(voice_id: str, name: Optional[str] = None) -> bool:
         Body=json.dumps(meta, indent=2),
         ContentType="application/json",
     )
-    # Update index entry
-    try:
-        resp = client.get_object(Bucket=bucket, Key=INDEX_KEY)
-        index = json.loads(resp["Body"].read().decode())
-    except client.exceptions.NoSuchKey:
-        return True
-    for i, e in enumerate(index):
-        if e.get("voice_id") == voice_id:
-            index[i] = meta
-            break
-    client.put_object(
-        Bucket=bucket,
-        Key=INDEX_KEY,
-        Body=json.dumps(index, indent=2),
-        ContentType="application/json",
-    )
+    _s3_index_apply("replace", voice_id, meta)
     return True
 
 
 def _s3_delete_voice(voice_id: str) -> bool:
     client = _s3_client()
     bucket = VOICE_STORAGE_BUCKET
+    keys = (f"{voice_id}{VOICE_DATA_EXT}", f"{voice_id}.json")
+    _s3_forget_cached_file(voice_id)
+    # Remove the index entry while both objects are removed in a single DeleteObjects request
+    f_index = _s3_pool.submit(_s3_index_apply, "del", voice_id)
     ok = False
-    for key in (f"{voice_id}{VOICE_DATA_EXT}", f"{voice_id}.json"):
-        try:
-            client.delete_object(Bucket=bucket, Key=key)
-            ok = True
-        except Exception as e:
-            logging.warning("Could not delete s3 %s: %s", key, e)
     try:
-        resp = client.get_object(Bucket=bucket, Key=INDEX_KEY)
-        index = json.loads(resp["Body"].read().decode())
-        index = [e for e in index if e.get("voice_id") != voice_id]
-        client.put_object(
+        resp = client.delete_objects(
             Bucket=bucket,
-            Key=INDEX_KEY,
-            Body=json.dumps(index, indent=2),
-            ContentType="application/json",
+            Delete={"Objects": [{"Key": k} for k in keys], "Quiet": True},
         )
-    except client.exceptions.NoSuchKey:
-        pass
+        errors = resp.get("Errors") or []
+        for err in errors:
+            logging.warning("Could not delete s3 %s: %s", err.get("Key"), err.get("Message"))
+        ok = len(errors) < len(keys)
+    except Exception as e:
+        logging.warning("Could not delete s3 %s: %s", ", ".join(keys), e)
+    f_index.result()
     return ok
 
 
+# --- Metadata cache ---
+
+# S3 backend only (a local metadata file is one cheap read and always current across workers):
+# voice_id -> (expires_at, metadata), least recently used first. Local writes invalidate immediately;
+# the TTL bounds staleness for writes made by other processes (e.g. Celery clone workers). Misses are not cached.
+_META_TTL_SEC = 60.0
+_META_CACHE_MAX = 4096
+_meta_cache: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+_meta_lock = threading.Lock()
+# Parsed S3 index.json for list_voices: (expires_at, index)
+_INDEX_TTL_SEC = 5.0
+_s3_index_cache: Optional[tuple[float, list[dict]]] = None
+
+
+def _meta_cache_get(voice_id: str) -> Optional[dict]:
+    now = time.monotonic()
+    with _meta_lock:
+        hit = _meta_cache.get(voice_id)
+        if hit is None:
+            return None
+        if hit[0] <= now:
+            del _meta_cache[voice_id]
+            return None
+        _meta_cache.move_to_end(voice_id)
+        return dict(hit[1])
+
+
+def _meta_cache_put(voice_id: str, meta: dict) -> None:
+    with _meta_lock:
+        _meta_cache[voice_id] = (time.monotonic() + _META_TTL_SEC, dict(meta))
+        _meta_cache.move_to_end(voice_id)
+        while len(_meta_cache) > _META_CACHE_MAX:
+            _meta_cache.popitem(last=False)
+
+
+def _s3_list_voices_cached() -> list[dict]:
+    """S3 index.json with a short TTL so repeated list_voices calls skip the GET."""
+    global _s3_index_cache
+    hit = _s3_index_cache
+    if hit is not None and hit[0] > time.monotonic():
+        return list(hit[1])
+    index = _s3_list_voices()
+    _s3_index_cache = (time.monotonic() + _INDEX_TTL_SEC, index)
+    return list(index)
+
+
+def _invalidate_voice(voice_id: str) -> None:
+    """Drop cached metadata for voice_id and the cached S3 index after a write."""
+    global _s3_index_cache
+    with _meta_lock:
+        _meta_cache.pop(voice_id, None)
+        _s3_index_cache = None
+
+
 # --- Public API (dispatcher) ---
 
 def _use_s3() -> bool:
@@ -389,6 +761,7 @@ def save_embedding(
         _s3_save_embedding(voice_id, embedding, consent_scope=consent_scope, name=name, faction=faction)
     else:
         _local_save_embedding(voice_id, embedding, consent_scope=consent_scope, name=name, faction=faction)
+    _invalidate_voice(voice_id)
     if use_db():
         db_insert_voice(voice_id, (name or "").strip(), consent_scope, created_at, owner_id=owner_id, faction=faction)
 
@@ -407,12 +780,13 @@ def save_voice_from_file(
         _s3_save_voice_from_file(voice_id, voice_file_path, consent_scope=consent_scope, name=name, faction=faction)
     else:
         _local_save_voice_from_file(voice_id, voice_file_path, consent_scope=consent_scope, name=name, faction=faction)
+    _invalidate_voice(voice_id)
     if use_db():
         db_insert_voice(voice_id, (name or "").strip(), consent_scope, created_at, owner_id=owner_id, faction=faction)
 
 
 def load_embedding_path(voice_id: str) -> Optional[str]:
-    """Return path to voice file (.safetensors) if it exists. For S3, downloads to a temp file."""
+    """Return path to voice file (.safetensors) if it exists. For S3, downloads into a local file cache on first use."""
     if _use_s3():
         return _s3_load_embedding_path(voice_id)
     return _local_load_embedding_path(voice_id)
@@ -422,9 +796,15 @@ def get_metadata(voice_id: str, owner_id: Optional[str] = None) -> Optional[dict
     """Return metadata dict if voice exists. When use_db() and owner_id set, only return if voice belongs to owner."""
     if use_db():
         return db_get_voice(voice_id, owner_id=owner_id)
-    if _use_s3():
-        return _s3_get_metadata(voice_id)
-    return _local_get_metadata(voice_id)
+    if not _use_s3():
+        return _local_get_metadata(voice_id)
+    meta = _meta_cache_get(voice_id)
+    if meta is not None:
+        return meta
+    meta = _s3_get_metadata(voice_id)
+    if meta is not None:
+        _meta_cache_put(voice_id, meta)
+    return meta
 
 
 def list_voices(owner_id: Optional[str] = None) -> list[dict]:
@@ -432,7 +812,7 @@ def list_voices(owner_id: Optional[str] = None) -> list[dict]:
     if use_db():
         return db_list_voices(owner_id=owner_id)
     if _use_s3():
-        return _s3_list_voices()
+        return _s3_list_voices_cached()
     return _local_list_voices()
 
 
@@ -440,9 +820,9 @@ def update_metadata(voice_id: str, name: Optional[str] = None, owner_id: Optiona
     """Update metadata (e.g. name). Returns False if voice not found or (when owner_id set) not owned by owner."""
     if use_db():
         return db_update_voice(voice_id, name=name, owner_id=owner_id)
-    if _use_s3():
-        return _s3_update_metadata(voice_id, name=name)
-    return _local_update_metadata(voice_id, name=name)
+    ok = _s3_update_metadata(voice_id, name=name) if _use_s3() else _local_update_metadata(voice_id, name=name)
+    _invalidate_voice(voice_id)
+    return ok
 
 
 def delete_voice(voice_id: str, owner_id: Optional[str] = None) -> bool:
@@ -451,6 +831,7 @@ def delete_voice(voice_id: str, owner_id: Optional[str] = None) -> bool:
         if not db_get_voice(voice_id, owner_id=owner_id):
             return False
     ok = _s3_delete_voice(voice_id) if _use_s3() else _local_delete_voice(voice_id)
+    _invalidate_voice(voice_id)
     if use_db():
         ok = db_delete_voice(voice_id, owner_id=owner_id) or ok
     return ok